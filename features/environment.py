@@ -16,10 +16,12 @@ from pathlib import Path
 from types import SimpleNamespace
 
 import pandas as pd
+import requests
 from behave import fixture, use_fixture
 from features.support.git_helpers import create_commit, init_repo, tag_commit
 from features.support.issue_helpers import link_commit_to_issue
 from playwright.sync_api import sync_playwright
+from requests.adapters import HTTPAdapter
 
 ROOT_DIR = Path(__file__).resolve().parents[1]
 SRC_DIR = ROOT_DIR / "src"
@@ -78,6 +80,8 @@ class ServerProcess:
         argv += ["--repo", str(repo_path), "--port", str(port)]
         argv += ["--no-browser"]
         argv += ["--debug"]
+        # Steps read the workbook right after a POST, so write edits without delay.
+        argv += ["--save-delay", "0"]
 
         env = os.environ.copy()
         src_dir = ROOT_DIR / "src"
@@ -229,14 +233,26 @@ def server_farm(context, **_kwargs):
     farm.shutdown_all()
 
 
+@fixture
+def http_session(context, **_kwargs):
+    """Share one keep-alive requests.Session across all HTTP steps."""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=4)
+    session.mount("http://", adapter)
+    context.http = session
+    yield session
+    session.close()
+
+
 @fixture
 def composite_fixture(context, **_kwargs):
-    """Run all core setup fixtures: temp directory, Git repo, xlsx file, and app server."""
+    """Run all core setup fixtures: temp directory, Git repo, xlsx file, app server, and HTTP session."""
 
     use_fixture(temp_directory, context)
     use_fixture(git_repo, context)
     use_fixture(xlsx_file, context)
     use_fixture(server_farm, context)
+    use_fixture(http_session, context)
 
 
 @fixture
@@ -267,11 +283,20 @@ def before_scenario(context, scenario):
     """Behave hook: Selects and launches the appropriate server fixture for the test.
 
     Chooses between server modes (e.g. with or without .xlsx file) based on scenario tags.
-    The server is launched lazily via context.server_farm.get(mode).
+    The server is launched lazily via context.server_farm.get(mode). URL templates for the
+    selected server are stashed on context.urls for the step modules.
     """
     mode = "xlsx" if "with_xlsx" in scenario.effective_tags else "no_xlsx"
     context.server = context.server_farm.get(mode)
 
+    base = context.server.base_url
+    context.urls = SimpleNamespace(
+        issue=base + "/issue/{}",
+        issue_update=base + "/issue/{}/update",
+        commit=base + "/commit/{}",
+        update=base + "/commit/{}/update",
+    )
+
 
 def after_scenario(context, scenario):
     """Attach server logs to the scenario and print them if the scenario failed."""
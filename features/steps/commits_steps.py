@@ -2,13 +2,16 @@
 
 import re
 
-import requests
 from behave import given, then, when  # pylint: disable=no-name-in-module
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
+from features.support.html_helpers import response_text
 from hamcrest import assert_that, contains_string, equal_to, is_not, none, not_
 
 from git_release_notes.utils.git import get_commit_parents_and_children
 
+# Link assertions only ever look at <a> elements.
+_LINK_STRAINER = SoupStrainer("a")
+
 # pylint: disable=missing-function-docstring
 
 
@@ -56,42 +59,44 @@ def step_known_commit(context, alias):
 
 @when("I GET the detail page for that commit")
 def step_get_commit_detail(context):
-    url = f"{context.server.base_url}/commit/{context.commit_sha}"
-    context.response = requests.get(url, timeout=5)
+    url = context.urls.commit.format(context.commit_sha)
+    context.response = context.http.get(url, timeout=5)
 
 
 @then('the page should show follows "{follows_tag}"')
 def step_response_shows_follows(context, follows_tag):
     assert_that(context.response.status_code, equal_to(200))
+    text = response_text(context)
     if follows_tag == "(none)":
-        assert_that(context.response.text, not_(contains_string("Follows:")))
+        assert_that(text, not_(contains_string("Follows:")))
     else:
         expected_target_sha = context.fixture_repo.tag_to_sha[follows_tag]
-        assert_that(context.response.text, contains_string("Follows:"))
-        assert_that(context.response.text, contains_string(follows_tag))
-        assert_that(context.response.text, contains_string(expected_target_sha))
+        assert_that(text, contains_string("Follows:"))
+        assert_that(text, contains_string(follows_tag))
+        assert_that(text, contains_string(expected_target_sha))
 
 
 @then('the page should show precedes "{precedes_tag}"')
 def step_response_shows_precedes(context, precedes_tag):
+    text = response_text(context)
     if precedes_tag == "(none)":
-        assert_that(context.response.text, not_(contains_string("Precedes:")))
+        assert_that(text, not_(contains_string("Precedes:")))
     else:
         expected_target_sha = context.fixture_repo.tag_to_sha[precedes_tag]
-        assert_that(context.response.text, contains_string("Precedes:"))
-        assert_that(context.response.text, contains_string(precedes_tag))
-        assert_that(context.response.text, contains_string(expected_target_sha))
+        assert_that(text, contains_string("Precedes:"))
+        assert_that(text, contains_string(precedes_tag))
+        assert_that(text, contains_string(expected_target_sha))
 
 
 @then("the page should contain a describe name")
 def step_assert_describe_name_present(context):
-    describe = context.response.text
+    describe = response_text(context)
     assert re.search(r"rel-\d+\.\d+(?:-\d+-g[0-9a-f]{7})?", describe)
 
 
 @then("the page should have a back link to the index anchor for that commit")
 def step_check_back_link_anchor(context):
-    soup = BeautifulSoup(context.response.text, "html.parser")
+    soup = BeautifulSoup(context.response.content, "lxml", parse_only=_LINK_STRAINER)
     back_link = soup.find("a", id="back-link")
     assert_that(back_link, is_not(none()), "Back link not found")
     expected_href = f"/#sha-{context.commit_sha[:7]}"
@@ -100,19 +105,21 @@ def step_check_back_link_anchor(context):
 
 @then("the page should contain a metadata form with an issue field")
 def step_assert_issue_field_present(context):
-    assert '<label for="issue"' in context.response.text
-    assert 'name="issue"' in context.response.text
+    text = response_text(context)
+    assert '<label for="issue"' in text
+    assert 'name="issue"' in text
 
 
 @then("the page should contain a metadata form with a release field")
 def step_assert_release_field_present(context):
-    assert '<label for="release"' in context.response.text
-    assert 'name="release"' in context.response.text
+    text = response_text(context)
+    assert '<label for="release"' in text
+    assert 'name="release"' in text
 
 
 @then('the page should contain a link labeled "{label}"')
 def step_assert_link_label_present(context, label):
-    soup = BeautifulSoup(context.response.text, "html.parser")
+    soup = BeautifulSoup(context.response.content, "lxml", parse_only=_LINK_STRAINER)
     links = soup.find_all("a")
     assert any(label in link.text for link in links), f"Expected link labeled '{label}' not found."
 
@@ -123,7 +130,7 @@ def step_assert_parent_link_present(context):
     repo = context.repo_path
     parents, _ = get_commit_parents_and_children(sha, str(repo))
 
-    soup = BeautifulSoup(context.response.text, "html.parser")
+    soup = BeautifulSoup(context.response.content, "lxml", parse_only=_LINK_STRAINER)
     link_hrefs = [a["href"] for a in soup.find_all("a", href=True)]
     for p in parents:
         expected = f"/commit/{p}"
@@ -1,8 +1,8 @@
 """Steps for commits.feature."""
 
 import pandas as pd
-import requests
 from behave import then, when  # pylint: disable=no-name-in-module
+from features.support.html_helpers import response_text
 from hamcrest import assert_that, contains_string, equal_to
 
 # pylint: disable=missing-function-docstring
@@ -11,8 +11,8 @@ from hamcrest import assert_that, contains_string, equal_to
 @when('I submit a new issue slug "{slug}" for that commit')
 def step_submit_issue_slug(context, slug):
     sha = context.commit_sha
-    context.response = requests.post(
-        f"{context.server.base_url}/commit/{sha}/update",
+    context.response = context.http.post(
+        context.urls.update.format(sha),
         data={"issue": slug},
         timeout=60,
     )
@@ -21,7 +21,7 @@ def step_submit_issue_slug(context, slug):
 @then('the commit page should show the updated issue slug "{slug}"')
 def step_commit_page_shows_issue(context, slug):
     assert_that(context.response.status_code, equal_to(200))
-    assert_that(context.response.text, contains_string(slug))
+    assert_that(response_text(context), contains_string(slug))
 
 
 @then('the spreadsheet should contain the issue slug "{slug}" for that commit')
@@ -38,8 +38,8 @@ def step_excel_contains_updated_issue(context, slug):
 @when('I submit a new release value "{value}" for that commit')
 def step_submit_release_value(context, value):
     sha = context.commit_sha
-    context.response = requests.post(
-        f"{context.server.base_url}/commit/{sha}/update",
+    context.response = context.http.post(
+        context.urls.update.format(sha),
         data={"release": value},
         timeout=60,
     )
@@ -48,7 +48,7 @@ def step_submit_release_value(context, value):
 @then('the commit page should show the updated release value "{value}"')
 def step_commit_page_shows_release(context, value):
     assert_that(context.response.status_code, equal_to(200))
-    assert_that(context.response.text, contains_string(value))
+    assert_that(response_text(context), contains_string(value))
 
 
 @then('the spreadsheet should contain the release value "{value}" for that commit')
@@ -1,18 +1,20 @@
 """Steps for edit_from_index.feature."""
 
-import requests
 from behave import then, when
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
+from features.support.html_helpers import response_text
 from hamcrest import assert_that, contains_string, equal_to, is_not, none
 
+_FORM_STRAINER = SoupStrainer(["form", "input"])
+
 
 @when('I submit a new issue slug "{slug}" for that commit via the index form')
 def step_submit_issue_from_index(context, slug):
     # Target the commit seeded with the "allow-editing" issue slug
     sha = context.fixture_repo.issue_map["allow-editing"]
     context.commit_sha = sha
-    context.response = requests.post(
-        f"{context.server.base_url}/commit/{sha}/update",
+    context.response = context.http.post(
+        context.urls.update.format(sha),
         data={"issue": slug},
         timeout=30,
     )
@@ -22,8 +24,8 @@ def step_submit_issue_from_index(context, slug):
 def step_submit_release_from_index(context, value):
     sha = context.fixture_repo.sha_map["initial"]
     context.commit_sha = sha
-    context.response = requests.post(
-        f"{context.server.base_url}/commit/{sha}/update",
+    context.response = context.http.post(
+        context.urls.update.format(sha),
         data={"release": value},
         timeout=30,
     )
@@ -32,19 +34,19 @@ def step_submit_release_from_index(context, value):
 @then('the response should contain the updated issue slug "{slug}"')
 def step_response_contains_issue_slug(context, slug):
     assert_that(context.response.status_code, equal_to(200))
-    assert_that(context.response.text, contains_string(slug))
+    assert_that(response_text(context), contains_string(slug))
 
 
 @then('the response should contain the updated release value "{value}"')
 def step_response_contains_release_value(context, value):
     assert_that(context.response.status_code, equal_to(200))
-    assert_that(context.response.text, contains_string(value))
+    assert_that(response_text(context), contains_string(value))
 
 
 @then('the response should contain a form field "{field}" for commit "{commit_label}"')
 def step_form_field_present_for_commit(context, field, commit_label):
     sha = context.fixture_repo.sha_map[commit_label]
-    soup = BeautifulSoup(context.response.text, "html.parser")
+    soup = BeautifulSoup(context.response.content, "lxml", parse_only=_FORM_STRAINER)
 
     # form is now separate and referenced by ID
     form_id = f"form-{sha}"
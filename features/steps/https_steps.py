@@ -1,4 +1,3 @@
-import requests
 from behave import when
 
 
@@ -11,4 +10,4 @@ def step_post_ajax_update(context, field, value):
     headers = {"X-Requested-With": "fetch"}
 
     # Store in the same attribute your other steps expect
-    context.response = requests.post(url, data=data, headers=headers)
+    context.response = context.http.post(url, data=data, headers=headers)
@@ -1,8 +1,8 @@
 """Steps for index.feature."""
 
-import requests
 from behave import given, then, when  # pylint: disable=no-name-in-module
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
+from features.support.html_helpers import response_text
 from hamcrest import assert_that, equal_to, is_not, none
 
 # pylint: disable=missing-function-docstring
@@ -26,36 +26,40 @@ def step_assert_file_backed_mode(context):
 @when("I visit the commit index")
 @when("I GET the root page")
 def step_get_root(context):
-    context.response = requests.get(f"{context.server.base_url}/", timeout=5)
+    context.response = context.http.get(f"{context.server.base_url}/", timeout=5)
 
 
 @then('the response should contain "{text}"')
 def step_response_contains(context, text):
     assert context.response.status_code == 200
-    assert text in context.response.text
+    assert text in response_text(context)
 
 
 @then('the response should contain the issue slug "{slug}"')
 def step_response_contains_issue_slug(context, slug):
     assert context.response.status_code == 200
-    assert slug in context.response.text, f"Issue slug '{slug}' not found in response {context.response.text}"
+    assert slug in response_text(
+        context
+    ), f"Issue slug '{slug}' not found in response {context.response.text}"
 
 
 @then('the response should contain an anchor id for commit "{commit_label}"')
 def step_anchor_id_for_commit(context, commit_label):
-    sha = context.fixture_repo.shas[1] if commit_label == "middle" else None
+    sha = context.fixture_repo.sha_map.get(commit_label)
     assert sha, f"No known SHA for label '{commit_label}'"
-    soup = BeautifulSoup(context.response.text, "html.parser")
-    el = soup.find(id=f"sha-{sha[:7]}")
+    anchor_id = f"sha-{sha[:7]}"
+    soup = BeautifulSoup(context.response.content, "lxml", parse_only=SoupStrainer(id=anchor_id))
+    el = soup.find(id=anchor_id)
     assert_that(el, is_not(none()), f"No element with id='sha-{sha[:7]}'")
 
 
 def _find_row_for_current_commit(context):
     assert context.response.status_code == 200, "Expected a successful index response before querying rows"
-    soup = BeautifulSoup(context.response.text, "html.parser")
     commit_sha = getattr(context, "commit_sha", None)
     assert commit_sha, "context.commit_sha was not set"
-    row = soup.find("tr", id=f"sha-{commit_sha[:7]}")
+    row_id = f"sha-{commit_sha[:7]}"
+    soup = BeautifulSoup(context.response.content, "lxml", parse_only=SoupStrainer("tr", id=row_id))
+    row = soup.find("tr", id=row_id)
     assert row is not None, f"Could not find table row for commit {commit_sha[:7]}"
     return row
 
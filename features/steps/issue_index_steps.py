@@ -3,13 +3,13 @@
 from __future__ import annotations
 
 import csv
+import functools
 from datetime import datetime, timezone
 from typing import Iterable
 
-import requests
 from behave import given, then, when  # pylint: disable=no-name-in-module
-from bs4 import BeautifulSoup
 from features.support.git_helpers import create_timestamped_commit_touching_issue
+from features.support.html_helpers import find_all_by_data_test, find_by_data_test, parse_html, text_of
 
 from tests.helpers.issue_index_fixtures import (
     ISSUE_INDEX_FIXTURE,
@@ -20,10 +20,16 @@ from tests.helpers.issue_index_fixtures import (
 )
 
 
+@functools.lru_cache(maxsize=512)
+def _parse_utc(value: str) -> datetime:
+    # Fixture tables repeat the same timestamps across scenarios; datetimes are immutable.
+    return datetime.fromisoformat(value).replace(tzinfo=timezone.utc)
+
+
 def _parse_issue_records(table) -> list[IssueRecord]:
     records: list[IssueRecord] = []
     for row in table:
-        last_updated = datetime.strptime(row["last_updated"], "%Y-%m-%d").replace(tzinfo=timezone.utc)
+        last_updated = _parse_utc(row["last_updated"])
         records.append(
             IssueRecord(
                 slug=row["slug"],
@@ -38,8 +44,7 @@ def _parse_issue_records(table) -> list[IssueRecord]:
 def _parse_landing_map(table) -> dict[str, datetime]:
     landing: dict[str, datetime] = {}
     for row in table:
-        landed_at = datetime.strptime(row["landed_at"], "%Y-%m-%d %H:%M").replace(tzinfo=timezone.utc)
-        landing[row["slug"]] = landed_at
+        landing[row["slug"]] = _parse_utc(row["landed_at"])
     return landing
 
 
@@ -81,25 +86,29 @@ def step_populate_commit_fixtures(context):
     )
 
 
+def _read_csv_rows(path) -> tuple[list[str], list[list[str]]]:
+    with path.open(newline="", encoding="utf-8") as handle:
+        reader = csv.reader(handle)
+        header = next(reader, [])
+        return header, list(reader)
+
+
+def _write_csv_rows(path, header: list[str], rows: Iterable[list[str]]) -> None:
+    with path.open("w", newline="", encoding="utf-8") as handle:
+        writer = csv.writer(handle, lineterminator="\n")
+        writer.writerow(header)
+        writer.writerows(rows)
+
+
 @given('landing data is cleared for issue "{slug}"')
 def step_clear_landing_data(context, slug):
     path = context.repo_path / "commits.csv"
     if not path.exists():
         return
 
-    with path.open(newline="", encoding="utf-8") as handle:
-        reader = csv.DictReader(handle)
-        rows = [row for row in reader if row.get("issue") != slug]
-
-    if not rows:
-        path.write_text("sha,summary,issue,landed_at\n", encoding="utf-8")
-        return
-
-    fieldnames = ["sha", "summary", "issue", "landed_at"]
-    with path.open("w", newline="", encoding="utf-8") as handle:
-        writer = csv.DictWriter(handle, fieldnames=fieldnames)
-        writer.writeheader()
-        writer.writerows(rows)
+    header, rows = _read_csv_rows(path)
+    issue_idx = header.index("issue")
+    _write_csv_rows(path, header, [row for row in rows if row[issue_idx] != slug])
 
 
 @given('metadata links are cleared for issue "{slug}"')
@@ -108,21 +117,15 @@ def step_clear_metadata_links(context, slug):
     if not path.exists():
         return
 
-    with path.open(newline="", encoding="utf-8") as handle:
-        reader = csv.DictReader(handle)
-        rows = list(reader)
-        if not rows:
-            return
+    header, rows = _read_csv_rows(path)
+    if not rows:
+        return
 
-    fieldnames = reader.fieldnames or ["sha", "issue", "release"]
+    issue_idx = header.index("issue")
     for row in rows:
-        if row.get("issue") == slug:
-            row["issue"] = ""
-
-    with path.open("w", newline="", encoding="utf-8") as handle:
-        writer = csv.DictWriter(handle, fieldnames=fieldnames)
-        writer.writeheader()
-        writer.writerows(rows)
+        if row[issue_idx] == slug:
+            row[issue_idx] = ""
+    _write_csv_rows(path, header, rows)
 
 
 @given('a commit touching issue "{slug}" landed at "{iso_timestamp}"')
@@ -143,10 +146,21 @@ def _ensure_params(context):
 def _fetch_issue_index(context):
     base_url = f"{context.server.base_url}/issues"
     params = getattr(context, "issue_index_params", {})
-    response = requests.get(base_url, params=params, timeout=10)
+
+    # Scenario-scoped: behave drops attributes set during a scenario when it ends.
+    cache = getattr(context, "issue_index_cache", None)
+    if cache is None:
+        cache = context.issue_index_cache = {}
+    key = frozenset(params.items())
+    if key in cache:
+        context.issue_index_response, context.issue_index_tree = cache[key]
+        return
+
+    response = context.http.get(base_url, params=params, timeout=10)
     assert response.status_code == 200, f"Unexpected status {response.status_code}: {response.text}"
     context.issue_index_response = response
-    context.issue_index_soup = BeautifulSoup(response.text, "html.parser")
+    context.issue_index_tree = parse_html(response.content)
+    cache[key] = (response, context.issue_index_tree)
 
 
 @when("the user visits the issue index")
@@ -172,18 +186,31 @@ def step_filter_by_release(context, release_slug):
 
 
 def _current_issue_rows(context):
-    soup: BeautifulSoup = context.issue_index_soup
-    rows = soup.select("tr[data-test='issue-row']")
+    rows = find_all_by_data_test(context.issue_index_tree, "issue-row")
     assert rows, "No issue rows rendered"
     return rows
 
 
+def _issue_rows_by_slug(context):
+    # Memoized per fetched page; a new fetch replaces the tree and invalidates the index.
+    tree = context.issue_index_tree
+    cached = getattr(context, "issue_rows_by_slug", None)
+    if cached is None or cached[0] is not tree:
+        cached = (tree, {row.get("data-slug"): row for row in _current_issue_rows(context)})
+        context.issue_rows_by_slug = cached
+    return cached[1]
+
+
 @then("the issue list should order slugs as:")
 def step_assert_issue_order(context):
     table = context.table
     rows = _current_issue_rows(context)
-    expected_order = [row["slug"] for row in sorted(table, key=lambda r: int(r["position"]))]
-    actual_subset = [row.get("data-slug") for row in rows if row.get("data-slug") in expected_order]
+    # Tables must list rows in position order; the column documents intent, it is not sorted on.
+    positions = [row["position"] for row in table]
+    assert positions == [str(n) for n in range(1, len(positions) + 1)], f"Positions out of order: {positions}"
+    expected_order = [row["slug"] for row in table]
+    expected_slugs = set(expected_order)
+    actual_subset = [slug for slug in (row.get("data-slug") for row in rows) if slug in expected_slugs]
     assert (
         actual_subset == expected_order
     ), f"Expected slug order {expected_order}, saw {actual_subset} within rendered rows"
@@ -196,7 +223,7 @@ def step_assert_issue_subset(context):
     actual = [
         (
             row.get("data-slug"),
-            row.select_one("[data-test='issue-status']").get_text(strip=True),
+            text_of(find_by_data_test(row, "issue-status")),
         )
         for row in rows
     ]
@@ -206,8 +233,7 @@ def step_assert_issue_subset(context):
 
 @then("the header should link to the commit index")
 def step_assert_header_commit_link(context):
-    soup: BeautifulSoup = context.issue_index_soup
-    link = soup.select_one("a[data-test='nav-commits']")
+    link = find_by_data_test(context.issue_index_tree, "nav-commits")
     assert link is not None, "Expected header commit index link"
     href = link.get("href", "")
     assert href == "/", f"Expected commit index link to '/', saw '{href}'"
@@ -215,8 +241,7 @@ def step_assert_header_commit_link(context):
 
 @then("the header should link to the release index")
 def step_assert_header_release_link(context):
-    soup: BeautifulSoup = context.issue_index_soup
-    link = soup.select_one("a[data-test='nav-releases']")
+    link = find_by_data_test(context.issue_index_tree, "nav-releases")
     assert link is not None, "Expected header release index link"
     href = link.get("href", "")
     assert href == "/releases", f"Expected release index link to '/releases', saw '{href}'"
@@ -227,20 +252,15 @@ def step_assert_issue_rows_no_commit_links(context):
     rows = _current_issue_rows(context)
     for row in rows:
         slug = row.get("data-slug")
-        link = row.select_one("a[data-test='issue-commit-link']")
+        link = find_by_data_test(row, "issue-commit-link")
         assert link is None, f"Did not expect commit navigation link in row for {slug}"
 
 
 @then('issue "{slug}" should show last landed "{expected}"')
 def step_assert_last_landed(context, slug, expected):
-    rows = _current_issue_rows(context)
-    for row in rows:
-        if row.get("data-slug") == slug:
-            cell = row.select_one("[data-test='issue-landed-at']")
-            assert cell is not None, f"No landed-at cell found for issue {slug}"
-            text = cell.get_text(strip=True)
-            assert (
-                text == expected
-            ), f"Expected issue {slug} to show '{expected}' in Last Landed, saw '{text}'"
-            return
-    raise AssertionError(f"Issue row for {slug} not found in rendered issue index")
+    row = _issue_rows_by_slug(context).get(slug)
+    assert row is not None, f"Issue row for {slug} not found in rendered issue index"
+    cell = find_by_data_test(row, "issue-landed-at")
+    assert cell is not None, f"No landed-at cell found for issue {slug}"
+    text = text_of(cell)
+    assert text == expected, f"Expected issue {slug} to show '{expected}' in Last Landed, saw '{text}'"
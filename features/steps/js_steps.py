@@ -1,30 +1,29 @@
 from typing import Literal
 
 from behave import then, when
+from features.support.html_helpers import parse_html
+from lxml import etree
 from playwright.sync_api import expect
 
+# Compiled once at import; inputs sit outside their <form> and reference it via form="form-<sha>".
+_COMMIT_INPUT_XPATH = etree.XPath("//input[@name = $field and @form = $form]")
 
-def _active_matches(page, selector: str) -> bool:
-    return page.evaluate(
-        """sel => {
-      const a = document.activeElement;
-      try { return a && a.matches(sel); } catch { return false; }
-    }""",
-        selector,
-    )
 
-
-def _active_debug(page):
+def _active_state(page, selector: str) -> dict:
+    # One round-trip: whether activeElement matches, plus a description for failure output.
     return page.evaluate(
-        """() => {
+        """sel => {
       const a = document.activeElement;
-      if (!a) return {html: null, desc: "null"};
+      if (!a) return {ok: false, html: null, desc: "null"};
+      let ok = false;
+      try { ok = a.matches(sel); } catch { ok = false; }
       const desc = a.tagName.toLowerCase()
         + (a.id ? "#" + a.id : "")
         + (a.name ? `[name="${a.name}"]` : "")
         + (a.getAttribute && a.getAttribute("form") ? `[form="${a.getAttribute("form")}"]` : "");
-      return {html: a.outerHTML, desc};
-    }"""
+      return {ok, html: ok ? null : a.outerHTML, desc};
+    }""",
+        selector,
     )
 
 
@@ -33,6 +32,18 @@ def _input_for_current_sha(page, sha, name):
     return page.locator(f'input[name="{name}"][form="form-{sha}"]')
 
 
+def _index_url(context) -> str:
+    base_url = getattr(context, "base_url", "http://localhost:8888")
+    return f"{base_url}/"
+
+
+def _ensure_on_index(context) -> None:
+    """Navigate to the commit index unless the page is already showing it."""
+    target = _index_url(context)
+    if context.page.url != target:
+        context.page.goto(target, wait_until="domcontentloaded")
+
+
 def _edit_field_and_leave(
     context,
     field: Literal["issue", "release"],
@@ -43,15 +54,11 @@ def _edit_field_and_leave(
     Shared implementation for editing a field and leaving focus either by clicking away or tabbing.
     Sets context.expected_focus_selector (CSS) for the later assertion step.
     """
-    base_url = getattr(context, "base_url", "http://localhost:8888")
     sha = context.commit_sha
 
-    context.page.goto(f"{base_url}/", wait_until="domcontentloaded")
-    form_sel = f"form#form-{sha}"
-    input_sel = f'input[name="{field}"][form="form-{sha}"]'
-    context.page.wait_for_selector(form_sel, state="attached", timeout=3000)
-    context.page.wait_for_selector(input_sel, state="visible", timeout=3000)
+    _ensure_on_index(context)
 
+    # expect() auto-waits for the input to attach and become visible.
     current = _input_for_current_sha(context.page, sha, field)
     expect(current).to_be_visible(timeout=3000)
 
@@ -60,21 +67,26 @@ def _edit_field_and_leave(
     current.fill(value)
     expect(current).to_have_value(value, timeout=1000)
 
-    if mode == "click":
-        # Deterministic click-away: always switch to the sibling input in the same row.
-        other = "release" if field == "issue" else "issue"
-        next_sel = f'input[name="{other}"][form="form-{sha}"]'
-        context.expected_focus_selector = next_sel
-        target = context.page.locator(next_sel).first
-        target.scroll_into_view_if_needed()
-        target.click()
-    else:
-        # Tab to the *actual* next tabbable (could be an <a>)
-        current.press("Tab")
-        context.expected_focus_selector = _selector_for_active(context.page)
+    update_url = f"/commit/{sha}/update"
+
+    def _is_save(response) -> bool:
+        return response.request.method == "POST" and response.url.endswith(update_url)
 
-    # Give any AJAX/debounced save a beat to complete (tune or remove per your app).
-    context.page.wait_for_load_state("networkidle", timeout=3000)
+    # Leaving the field fires the blur-save; the POST completing is the signal we need.
+    with context.page.expect_response(_is_save, timeout=3000):
+        if mode == "click":
+            # Deterministic click-away: always switch to the sibling input in the same row.
+            other = "release" if field == "issue" else "issue"
+            next_sel = f'input[name="{other}"][form="form-{sha}"]'
+            context.expected_focus_selector = next_sel
+            target = context.page.locator(next_sel).first
+            target.scroll_into_view_if_needed()
+            target.click()
+        else:
+            # Tab to the *actual* next tabbable (could be an <a>). This must stay a native key
+            # press: a synthetic KeyboardEvent dispatched from JS does not move focus.
+            current.press("Tab")
+            context.expected_focus_selector = _selector_for_active(context.page)
 
 
 def _selector_for_active(page) -> str | None:
@@ -96,13 +108,6 @@ def _selector_for_active(page) -> str | None:
     )
 
 
-@when("I reload the page")
-def step_reload_page(context):
-    # Stay on current route; ensures we validate server round-trip after AJAX save.
-    context.page.reload(wait_until="domcontentloaded")
-    context.page.wait_for_load_state("networkidle", timeout=3000)
-
-
 @when('the user edits the {field} field to "{value}" and {navigation_mode} away')
 def step_edit_field_leave(
     context,
@@ -113,26 +118,32 @@ def step_edit_field_leave(
     _edit_field_and_leave(context, field, value, mode=navigation_mode.rstrip("s"))
 
 
+def _persisted_value(context, field: Literal["issue", "release"]) -> str:
+    # Read-only check of what the server rendered; no browser navigation needed.
+    response = context.http.get(_index_url(context), timeout=10)
+    assert response.status_code == 200, f"Unexpected status {response.status_code}: {response.text}"
+    inputs = _COMMIT_INPUT_XPATH(parse_html(response.content), field=field, form=f"form-{context.commit_sha}")
+    assert inputs, f"No {field} input rendered for commit {context.commit_sha}"
+    return inputs[0].get("value", "")
+
+
 @then('the issue value should be "{value}"')
 def step_assert_issue_value(context, value):
-    sha = context.commit_sha
-    issue = _input_for_current_sha(context.page, sha, "issue")
-    expect(issue).to_have_value(value, timeout=3000)
+    actual = _persisted_value(context, "issue")
+    assert actual == value, f"Expected issue value '{value}', saw '{actual}'"
 
 
 @then('the release value should be "{value}"')
 def step_assert_release_value(context, value):
-    sha = context.commit_sha
-    release = _input_for_current_sha(context.page, sha, "release")
-    expect(release).to_have_value(value, timeout=3000)
+    actual = _persisted_value(context, "release")
+    assert actual == value, f"Expected release value '{value}', saw '{actual}'"
 
 
 @when("the focus should be on the expected element after the save")
 def step_cursor_on_expected(context):
     assert getattr(context, "expected_focus_selector", None), "expected_focus_selector was not set"
-    ok = _active_matches(context.page, context.expected_focus_selector)
-    if not ok:
-        dbg = _active_debug(context.page)
+    dbg = _active_state(context.page, context.expected_focus_selector)
+    if not dbg["ok"]:
         raise AssertionError(
             f"Focus was not on: {context.expected_focus_selector!r}\n"
             f"Active element: {dbg['desc']}\n"
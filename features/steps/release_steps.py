@@ -5,9 +5,8 @@ from __future__ import annotations
 from datetime import datetime, timezone
 from typing import Dict
 
-import requests
 from behave import given, then, when  # pylint: disable=no-name-in-module
-from bs4 import BeautifulSoup
+from features.support.html_helpers import find_all_by_data_test, find_by_data_test, parse_html, text_of
 from hamcrest import assert_that, contains_string, equal_to, is_not, none
 
 from tests.helpers.issue_index_fixtures import IssueRecord, ensure_issue_files, write_metadata_csv
@@ -15,16 +14,11 @@ from tests.helpers.issue_index_fixtures import IssueRecord, ensure_issue_files,
 
 @given("release issues exist:")
 def step_release_issues_exist(context):
-    records = []
-    for row in context.table:
-        records.append(
-            IssueRecord(
-                slug=row["slug"],
-                status=row["status"],
-                release=row["release"],
-                last_updated=datetime.now(timezone.utc),
-            )
-        )
+    now = datetime.now(timezone.utc)
+    records = [
+        IssueRecord(slug=row["slug"], status=row["status"], release=row["release"], last_updated=now)
+        for row in context.table
+    ]
 
     ensure_issue_files(context.repo_path, records)
     context.release_issue_records = records
@@ -32,18 +26,12 @@ def step_release_issues_exist(context):
 
 @given("release metadata assigns commits to releases:")
 def step_release_metadata_assignments(context):
-    commit_issue_map: Dict[str, str] = {}
-    releases: Dict[str, str] = {}
+    sha_map = context.fixture_repo.sha_map
+    unknown = [row["commit_label"] for row in context.table if row["commit_label"] not in sha_map]
+    assert not unknown, f"Unknown commit label(s) {unknown}"
 
-    for row in context.table:
-        label = row["commit_label"]
-        issue = row["issue"]
-        release = row["release"]
-        sha = context.fixture_repo.sha_map.get(label)
-
-        assert sha, f"Unknown commit label '{label}'"
-        commit_issue_map[sha] = issue
-        releases[issue] = release
+    commit_issue_map: Dict[str, str] = {sha_map[row["commit_label"]]: row["issue"] for row in context.table}
+    releases: Dict[str, str] = {row["issue"]: row["release"] for row in context.table}
 
     write_metadata_csv(context.repo_path, commit_issue_map, releases=releases)
     context.release_commit_map = commit_issue_map
@@ -52,30 +40,29 @@ def step_release_metadata_assignments(context):
 @when("the user visits the release index")
 def step_visit_release_index(context):
     url = f"{context.server.base_url}/releases"
-    response = requests.get(url, timeout=10)
+    response = context.http.get(url, timeout=10)
     assert response.status_code == 200, f"Unexpected status {response.status_code} for {url}"
     context.release_index_response = response
-    context.release_index_soup = BeautifulSoup(response.text, "html.parser")
+    context.release_index_tree = parse_html(response.content)
 
 
 @then("the release list should show:")
 def step_assert_release_list(context):
-    soup: BeautifulSoup = context.release_index_soup
-    rows = soup.select("[data-test='release-row']")
+    rows = find_all_by_data_test(context.release_index_tree, "release-row")
     assert rows, "Expected at least one release row in the index"
 
     actual = {}
     for row in rows:
         release_slug = row.get("data-release")
-        commit_count_el = row.select_one("[data-test='release-commit-count']")
-        issue_count_el = row.select_one("[data-test='release-issue-count']")
+        commit_count_el = find_by_data_test(row, "release-commit-count")
+        issue_count_el = find_by_data_test(row, "release-issue-count")
         assert release_slug, "Release row missing data-release attribute"
         assert commit_count_el is not None, f"Release row {release_slug} missing commit count"
         assert issue_count_el is not None, f"Release row {release_slug} missing issue count"
         actual[release_slug] = {
-            "commit_count": commit_count_el.get_text(strip=True),
-            "issue_count": issue_count_el.get_text(strip=True),
-            "link": row.find("a", attrs={"data-test": "release-link"}),
+            "commit_count": text_of(commit_count_el),
+            "issue_count": text_of(issue_count_el),
+            "link": find_by_data_test(row, "release-link"),
         }
 
     for expected_row in context.table:
@@ -91,9 +78,9 @@ def step_assert_release_list(context):
 @when('the user visits the release detail for "{release_slug}"')
 def step_visit_release_detail(context, release_slug):
     url = f"{context.server.base_url}/release/{release_slug}"
-    response = requests.get(url, timeout=10)
+    response = context.http.get(url, timeout=10)
     context.release_detail_response = response
-    context.release_detail_soup = BeautifulSoup(response.text, "html.parser")
+    context.release_detail_tree = parse_html(response.content)
 
 
 @then("the release detail should list issues:")
@@ -101,14 +88,10 @@ def step_assert_release_detail_issues(context):
     response = context.release_detail_response
     assert response.status_code == 200, f"Unexpected status {response.status_code}: {response.text}"
 
-    soup: BeautifulSoup = context.release_detail_soup
-    rows = soup.select("[data-test='release-issue']")
+    rows = find_all_by_data_test(context.release_detail_tree, "release-issue")
     assert rows, "Expected issue rows in the release detail view"
 
-    actual = {
-        row.get("data-slug"): row.select_one("[data-test='release-issue-status']").get_text(strip=True)
-        for row in rows
-    }
+    actual = {row.get("data-slug"): text_of(find_by_data_test(row, "release-issue-status")) for row in rows}
 
     for expected_row in context.table:
         slug = expected_row["issue_slug"]
@@ -118,44 +101,47 @@ def step_assert_release_detail_issues(context):
 
 @then("the release detail should list commits:")
 def step_assert_release_detail_commits(context):
-    soup: BeautifulSoup = context.release_detail_soup
-    rows = soup.select("[data-test='release-commit']")
+    rows = find_all_by_data_test(context.release_detail_tree, "release-commit")
     assert rows, "Expected commit entries in the release detail view"
 
-    rendered_truncated = {row.get("data-sha"): row for row in rows if row.get("data-sha")}
+    rendered_truncated = {row.get("data-sha") for row in rows if row.get("data-sha")}
 
-    for expected_row in context.table:
-        label = expected_row["commit_label"]
-        sha = context.fixture_repo.sha_map.get(label)
-        assert sha, f"Unknown commit label '{label}'"
-        truncated = sha[:7]
-        assert truncated in rendered_truncated, f"Commit {label} ({truncated}) not listed in release detail"
+    sha_map = context.fixture_repo.sha_map
+    unknown = [row["commit_label"] for row in context.table if row["commit_label"] not in sha_map]
+    assert not unknown, f"Unknown commit label(s) {unknown}"
+
+    expected = {sha_map[row["commit_label"]][:7]: row["commit_label"] for row in context.table}
+    missing = expected.keys() - rendered_truncated
+    assert not missing, "Commits not listed in release detail: " + ", ".join(
+        f"{expected[sha]} ({sha})" for sha in sorted(missing)
+    )
 
 
 @then('the release detail should include issue note heading "{heading}"')
 def step_assert_release_detail_note_heading(context, heading):
     response = context.release_detail_response
     assert response.status_code == 200, f"Unexpected status {response.status_code}: {response.text}"
-    assert_that(response.text, contains_string(heading))
+    # Issue headings render as the text of each issue's detail link.
+    links = find_all_by_data_test(context.release_detail_tree, "release-issue-link")
+    titles = [text_of(link) for link in links]
+    assert heading in titles, f"Expected issue note heading '{heading}', saw {titles}"
 
 
 @then('the release detail should show summary "{summary_text}"')
 def step_assert_release_summary(context, summary_text):
-    soup: BeautifulSoup = context.release_detail_soup
-    summary = soup.select_one("[data-test='release-summary']")
+    summary = find_by_data_test(context.release_detail_tree, "release-summary")
     assert summary is not None, "Expected a release summary element"
-    actual = summary.get_text(strip=True)
+    actual = text_of(summary)
     assert_that(actual, equal_to(summary_text))
 
 
 @then("release issues should link to their detail pages")
 def step_assert_release_issue_links(context):
-    soup: BeautifulSoup = context.release_detail_soup
-    rows = soup.select("[data-test='release-issue']")
+    rows = find_all_by_data_test(context.release_detail_tree, "release-issue")
     assert rows, "Expected issues to be listed in the release detail"
     for row in rows:
         slug = row.get("data-slug")
-        link = row.select_one("a[data-test='release-issue-link']")
+        link = find_by_data_test(row, "release-issue-link")
         assert link is not None, f"Expected an issue link for {slug}"
         href = link.get("href", "")
         assert href == f"/issue/{slug}", f"Expected issue link href '/issue/{slug}', saw '{href}'"
@@ -163,12 +149,11 @@ def step_assert_release_issue_links(context):
 
 @then("release commits should link to their detail pages")
 def step_assert_release_commit_links(context):
-    soup: BeautifulSoup = context.release_detail_soup
-    rows = soup.select("[data-test='release-commit']")
+    rows = find_all_by_data_test(context.release_detail_tree, "release-commit")
     assert rows, "Expected commits to be listed in the release detail"
     for row in rows:
         short_sha = row.get("data-sha")
-        link = row.select_one("a[data-test='release-commit-link']")
+        link = find_by_data_test(row, "release-commit-link")
         assert link is not None, f"Expected a commit link for {short_sha}"
         href = link.get("href", "")
         assert_that(href, contains_string("/commit/"))
@@ -176,9 +161,8 @@ def step_assert_release_commit_links(context):
 
 @then("the release detail should surface tag metadata")
 def step_assert_release_tag_metadata(context):
-    soup: BeautifulSoup = context.release_detail_soup
-    element = soup.select_one("[data-test='release-tag-metadata']")
+    element = find_by_data_test(context.release_detail_tree, "release-tag-metadata")
     assert element is not None, "Expected tag metadata to be displayed"
-    text = element.get_text(strip=True)
+    text = text_of(element)
     assert text, "Tag metadata element should not be empty"
     assert "rel-0.1" in text, f"Expected tag metadata to mention rel-0.1, saw '{text}'"
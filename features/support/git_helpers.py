@@ -2,22 +2,24 @@ import os
 import subprocess
 from pathlib import Path
 
+# Passed on every invocation so fixture repos need no `git config` calls of their own.
+_GIT_IDENTITY = ("-c", "user.name=Test User", "-c", "user.email=test@example.com")
 
-def init_repo(repo_path: Path) -> None:
-    """Initialize a Git repository with user config."""
 
-    subprocess.run(["git", "init"], cwd=repo_path, check=True)
-    subprocess.run(["git", "config", "user.name", "Test User"], cwd=repo_path, check=True)
-    subprocess.run(["git", "config", "user.email", "test@example.com"], cwd=repo_path, check=True)
+def _git(repo_path: Path, *args: str, env: dict | None = None) -> None:
+    subprocess.run(["git", *_GIT_IDENTITY, *args], cwd=repo_path, check=True, env=env)
 
 
-def create_commit(repo_path: Path, message: str) -> str:
-    """Create a commit with the given message and return its SHA."""
+def _read_head_sha(repo_path: Path) -> str:
+    """Resolve HEAD from the .git directory, falling back to rev-parse for packed refs."""
 
-    with open(repo_path / "file.txt", "a", encoding="utf-8") as f:
-        f.write(f"{message}\n")
-    subprocess.run(["git", "add", "."], cwd=repo_path, check=True)
-    subprocess.run(["git", "commit", "-m", message], cwd=repo_path, check=True)
+    git_dir = repo_path / ".git"
+    head = (git_dir / "HEAD").read_text(encoding="utf-8").strip()
+    if not head.startswith("ref: "):
+        return head
+    ref_path = git_dir / head[len("ref: ") :]
+    if ref_path.exists():
+        return ref_path.read_text(encoding="utf-8").strip()
     return subprocess.run(
         ["git", "rev-parse", "HEAD"],
         cwd=repo_path,
@@ -27,6 +29,22 @@ def create_commit(repo_path: Path, message: str) -> str:
     ).stdout.strip()
 
 
+def init_repo(repo_path: Path) -> None:
+    """Initialize a Git repository; commits made through these helpers carry their own identity."""
+
+    subprocess.run(["git", "init"], cwd=repo_path, check=True)
+
+
+def create_commit(repo_path: Path, message: str) -> str:
+    """Create a commit with the given message and return its SHA."""
+
+    with open(repo_path / "file.txt", "a", encoding="utf-8") as f:
+        f.write(f"{message}\n")
+    _git(repo_path, "add", ".")
+    _git(repo_path, "commit", "-m", message)
+    return _read_head_sha(repo_path)
+
+
 def create_commit_touching_issue(repo_path: Path, slug: str, message: str, *, env: dict | None = None) -> str:
     """
     Create a commit that touches an issue Markdown file and return its SHA.
@@ -49,22 +67,15 @@ def create_commit_touching_issue(repo_path: Path, slug: str, message: str, *, en
             f.write("\n<!-- created by test commit -->\n")
 
     rel_path = issue_path.relative_to(repo_path)
-    subprocess.run(["git", "add", str(rel_path)], cwd=repo_path, check=True, env=env)
-    subprocess.run(["git", "commit", "-m", message], cwd=repo_path, check=True, env=env)
-    return subprocess.run(
-        ["git", "rev-parse", "HEAD"],
-        cwd=repo_path,
-        capture_output=True,
-        text=True,
-        check=True,
-        env=env,
-    ).stdout.strip()
+    _git(repo_path, "add", str(rel_path), env=env)
+    _git(repo_path, "commit", "-m", message, env=env)
+    return _read_head_sha(repo_path)
 
 
 def tag_commit(repo_path: Path, sha: str, tag_name: str) -> None:
     """Create a lightweight tag pointing to the specified commit SHA."""
 
-    subprocess.run(["git", "tag", tag_name, sha], cwd=repo_path, check=True)
+    _git(repo_path, "tag", tag_name, sha)
 
 
 def create_timestamped_commit_touching_issue(
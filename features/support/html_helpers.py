@@ -0,0 +1,56 @@
+"""Small parsing helpers for asserting on server-rendered pages in step definitions."""
+
+from __future__ import annotations
+
+import lxml.html
+from bs4 import BeautifulSoup
+from lxml import etree
+
+# Compiled once; the data-test value is bound per call via the $name variable.
+_BY_DATA_TEST = etree.XPath(".//*[@data-test = $name]")
+
+
+def parse_html(content: bytes) -> lxml.html.HtmlElement:
+    """Parse a raw response body into an lxml element tree."""
+
+    return lxml.html.fromstring(content)
+
+
+def find_all_by_data_test(node: etree._Element, name: str) -> list[lxml.html.HtmlElement]:
+    """Return every descendant of ``node`` whose data-test attribute equals ``name``."""
+
+    return _BY_DATA_TEST(node, name=name)
+
+
+def find_by_data_test(node: etree._Element, name: str) -> lxml.html.HtmlElement | None:
+    """Return the first descendant of ``node`` tagged ``name``, or None."""
+
+    matches = _BY_DATA_TEST(node, name=name)
+    return matches[0] if matches else None
+
+
+def text_of(node: etree._Element) -> str:
+    """Concatenate the stripped text fragments of ``node``."""
+
+    return "".join(fragment.strip() for fragment in node.itertext())
+
+
+def response_soup(context) -> BeautifulSoup:
+    """Parse ``context.response`` once; later steps on the same response reuse the soup."""
+
+    cached = getattr(context, "response_soup_cache", None)
+    if cached is None or cached[0] is not context.response:
+        cached = (context.response, BeautifulSoup(context.response.content, "lxml"))
+        context.response_soup_cache = cached
+    return cached[1]
+
+
+def response_text(context) -> str:
+    """Decode ``context.response`` once; ``Response.text`` re-decodes the body on every access."""
+
+    cached = getattr(context, "response_text_cache", None)
+    if cached is None or cached[0] is not context.response:
+        response = context.response
+        cached = (response, response.content.decode(response.encoding or "utf-8", errors="replace"))
+        context.response_text_cache = cached
+    return cached[1]
@@ -1,7 +1,6 @@
+import csv
 from pathlib import Path
 
-import pandas as pd
-
 
 def create_issue_file(
     repo_path: Path,
@@ -26,14 +25,18 @@ def create_issue_file(
 
 def link_commit_to_issue(repo_path: Path, sha: str, issue_slug: str) -> None:
     metadata_path = repo_path / "git-view.metadata.csv"
+    fieldnames = ["sha", "issue", "release"]
+    rows: dict[str, dict[str, str]] = {}
     if metadata_path.exists():
-        df = pd.read_csv(metadata_path)
-    else:
-        df = pd.DataFrame(columns=["sha", "issue", "release"])
-
-    if sha in df["sha"].values:
-        df.loc[df["sha"] == sha, "issue"] = issue_slug
-    else:
-        df.loc[len(df)] = [sha, issue_slug, ""]
-
-    df.to_csv(metadata_path, index=False)
+        with metadata_path.open(newline="", encoding="utf-8") as handle:
+            reader = csv.DictReader(handle)
+            fieldnames = list(reader.fieldnames or fieldnames)
+            rows = {row["sha"]: row for row in reader}
+
+    row = rows.setdefault(sha, {"sha": sha, "release": ""})
+    row["issue"] = issue_slug
+
+    with metadata_path.open("w", newline="", encoding="utf-8") as handle:
+        writer = csv.DictWriter(handle, fieldnames=fieldnames, restval="", lineterminator="\n")
+        writer.writeheader()
+        writer.writerows(rows.values())
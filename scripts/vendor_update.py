@@ -10,6 +10,7 @@ import io
 import json
 import sys
 import tarfile
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Iterable, List
@@ -182,23 +183,41 @@ def download_tarball(plan: DownloadPlan, *, force: bool) -> None:
 
     print(f"[fetch] {plan.source_url}")
     archive_data = fetch_bytes(plan.source_url)
-    with tarfile.open(fileobj=io.BytesIO(archive_data), mode="r:gz") as tar:
-        for asset_file in plan.files:
-            member = tar.getmember(asset_file.member)  # type: ignore[arg-type]
-            extracted = tar.extractfile(member)
+    wanted = {asset_file.member: asset_file for asset_file in plan.files}
+    # Stream the archive once ("r|gz") and stop as soon as every wanted member has been
+    # written, rather than indexing all members and scanning them per getmember() call.
+    with tarfile.open(fileobj=io.BytesIO(archive_data), mode="r|gz") as tar:
+        for info in tar:
+            asset_file = wanted.pop(info.name, None)
+            if asset_file is None:
+                continue
+            extracted = tar.extractfile(info)
             if extracted is None:
                 raise FileNotFoundError(f"Member {asset_file.member} missing from tarball")
             write_file(asset_file.dest, extracted.read())
+            if not wanted:
+                break
+    if wanted:
+        raise FileNotFoundError(f"Members missing from tarball: {', '.join(sorted(wanted))}")
+
+
+HASH_CHUNK_SIZE = 1 << 20
 
 
 def compute_hashes(path: Path) -> dict[str, str | int]:
-    data = path.read_bytes()
-    sha256 = hashlib.sha256(data).hexdigest()
-    sha384 = base64.b64encode(hashlib.sha384(data).digest()).decode()
+    # One streamed pass feeds both digests, instead of holding the whole file for two hashes.
+    h256 = hashlib.sha256(usedforsecurity=False)
+    h384 = hashlib.sha384(usedforsecurity=False)
+    size = 0
+    with path.open("rb") as fh:
+        while chunk := fh.read(HASH_CHUNK_SIZE):
+            h256.update(chunk)
+            h384.update(chunk)
+            size += len(chunk)
     return {
-        "sha256": sha256,
-        "sha384": sha384,
-        "size": len(data),
+        "sha256": h256.hexdigest(),
+        "sha384": base64.b64encode(h384.digest()).decode(),
+        "size": size,
     }
 
 
@@ -212,26 +231,40 @@ def build_manifest(files: Iterable[AssetFile]) -> dict[str, dict[str, str | int]
     return manifest
 
 
-def run(force: bool) -> None:
-    VENDOR_DIR.mkdir(parents=True, exist_ok=True)
-
-    processed_files: list[AssetFile] = []
+def fetch_plan(plan: DownloadPlan, *, force: bool) -> None:
+    """Download every file of one plan, reporting which URL failed before re-raising."""
 
-    for plan in ASSETS:
-        if plan.is_tarball:
+    if plan.is_tarball:
+        try:
+            download_tarball(plan, force=force)
+        except (URLError, HTTPError) as exc:
+            print(f"[error] Failed to download tarball {plan.source_url}: {exc}", file=sys.stderr)
+            raise
+    else:
+        for asset_file in plan.files:
             try:
-                download_tarball(plan, force=force)
+                download_file(plan, asset_file, force=force)
             except (URLError, HTTPError) as exc:
-                print(f"[error] Failed to download tarball {plan.source_url}: {exc}", file=sys.stderr)
+                print(f"[error] Failed to download {asset_file.url}: {exc}", file=sys.stderr)
                 raise
-        else:
-            for asset_file in plan.files:
-                try:
-                    download_file(plan, asset_file, force=force)
-                except (URLError, HTTPError) as exc:
-                    print(f"[error] Failed to download {asset_file.url}: {exc}", file=sys.stderr)
-                    raise
-        processed_files.extend(plan.files)
+
+
+def run(force: bool) -> None:
+    VENDOR_DIR.mkdir(parents=True, exist_ok=True)
+
+    # Downloads are network-bound, so fetch the plans concurrently; the first failure is
+    # raised as soon as it completes, after cancelling the plans that have not started yet
+    # (ones already running finish first). mkdir(exist_ok=True) in write_file is race-safe.
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        futures = [pool.submit(fetch_plan, plan, force=force) for plan in ASSETS]
+        try:
+            for future in as_completed(futures):
+                future.result()
+        except BaseException:
+            pool.shutdown(cancel_futures=True)
+            raise
+
+    processed_files = [asset_file for plan in ASSETS for asset_file in plan.files]
 
     manifest = build_manifest(processed_files)
     MANIFEST_PATH.parent.mkdir(parents=True, exist_ok=True)
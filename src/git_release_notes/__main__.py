@@ -13,7 +13,9 @@ from types import FrameType
 from typing import Iterable
 
 import pandas as pd
+from tornado.httpserver import HTTPServer
 from tornado.ioloop import IOLoop
+from tornado.netutil import bind_sockets
 from tornado.web import Application
 
 from .handlers.commit import CommitHandler, CommitResolveHandler
@@ -74,8 +76,15 @@ def make_app(
     excel_path: str | None,
     *,
     use_local_assets: bool | None = None,
+    metadata_save_delay: float = 0.0,
+    debug: bool = False,
 ) -> Application:
-    """Create the Tornado application configured with handlers and settings."""
+    """
+    Create the Tornado application configured with handlers and settings.
+
+    ``debug`` turns on Tornado's debug mode (autoreload, uncached templates and static
+    files, tracebacks in error pages); leave it off outside development.
+    """
 
     if df is not None:
         store = SpreadsheetCommitMetadataStore(df, excel_path)
@@ -102,12 +111,13 @@ def make_app(
             (r"/_debug/git-stats", GitStatsHandler),
         ],
         template_path=str(TEMPLATE_DIR),
-        debug=True,
+        debug=debug,
         static_path=str(static_dir),
         static_url_prefix="/static/",
         tag_pattern=tag_pattern,
         excel_path=excel_path,
         commit_metadata_store=store,
+        metadata_save_delay=metadata_save_delay,
         issues_dir=repo_path / "issues",
         repo_path=repo_path,
         use_local_assets=use_local_assets,
@@ -137,7 +147,13 @@ def main() -> None:
         help="Path to the Git repository (default: current directory)",
     )
     parser.add_argument("--tag-pattern", default="rel-*", help="Pattern for release tags")
-    parser.add_argument("--debug", action="store_true", help="Enable debug logging")
+    parser.add_argument(
+        "--save-delay",
+        type=float,
+        default=1.0,
+        help="Seconds to wait after the last metadata edit before writing it to disk (default: 1.0)",
+    )
+    parser.add_argument("--debug", action="store_true", help="Enable debug logging and Tornado debug mode")
 
     args = parser.parse_args()
 
@@ -148,16 +164,9 @@ def main() -> None:
         logger.addHandler(handler)
         logger.setLevel(logging.DEBUG)
 
-    df: pd.DataFrame | None
-
-    if args.excel_path:
-        df = pd.read_excel(args.excel_path).fillna("")
-    else:
-        df = None
-
-    repo_path = Path(args.repo)
-    app = make_app(df, repo_path, args.tag_pattern, excel_path=args.excel_path)
-    app.listen(args.port)
+    # Bind before reading the workbook: the port is open straight away and the browser's first
+    # request waits in the listen backlog while the spreadsheet parses, instead of failing.
+    sockets = bind_sockets(args.port)
     url = f"http://localhost:{args.port}"
     print(f"Server running at {url}", flush=True)
     print(f"  Commit index: {url}/", flush=True)
@@ -167,10 +176,31 @@ def main() -> None:
         time.sleep(0.25)
         webbrowser.open(url)
 
+    df: pd.DataFrame | None
+
+    if args.excel_path:
+        df = pd.read_excel(args.excel_path).fillna("")
+    else:
+        df = None
+
+    repo_path = Path(args.repo)
+    app = make_app(
+        df,
+        repo_path,
+        args.tag_pattern,
+        excel_path=args.excel_path,
+        metadata_save_delay=args.save_delay,
+        debug=args.debug,
+    )
+    HTTPServer(app).add_sockets(sockets)
+
     loop = IOLoop.current()
     _install_signal_handlers(loop)
     _start_ioloop(loop)
 
+    # Write any edit still waiting out the save delay before the process exits.
+    app.settings["commit_metadata_store"].flush_pending_save()
+
 
 if __name__ == "__main__":
     main()
@@ -7,61 +7,132 @@ commit using `git describe`, `rev-list`, and `merge-base`.
 
 import fnmatch
 import logging
-import math
 import re
 import subprocess
-from typing import Optional
+from collections import OrderedDict
+from pathlib import Path
+from typing import Optional, Tuple
 
+from tornado.gen import multi
 from tornado.web import HTTPError, RequestHandler
 
 from ..utils.git import (
     find_follows_tag,
     find_precedes_tag,
     get_commit_parents_and_children,
-    get_describe_name,
-    run_git,
+    get_describe_name_async,
+    get_git_session,
+    run_git_async,
+    run_in_git_slot,
 )
 from ..utils.issue_suggestions import compute_issue_suggestion
+from ..utils.metadata_store import CommitMetadataStore
 from ..utils.release_suggestions import compute_release_suggestion
 
 logger = logging.getLogger(__name__)
 
+# Parsed `git show` output keyed by (repo_path, full_sha). Commits are immutable, so entries
+# never go stale; the LRU bound only limits memory.
+_SHOW_CACHE: "OrderedDict[Tuple[str, str], Tuple[str, str, Tuple[str, ...]]]" = OrderedDict()
+_SHOW_CACHE_MAX = 1024
+_FULL_SHA_RE = re.compile(r"[0-9a-f]{40}")
+_DIFF_SEPARATOR = "\ndiff --git "
+
+
+def _split_show_output(output: str) -> Tuple[str, str, Tuple[str, ...]]:
+    """
+    Split `git show` output into (header, diff, touched paths).
+
+    Sections are located with str.find rather than split/partition, so a large diff is
+    copied once (into the returned diff slice) instead of once per intermediate string.
+    """
+    first = output.find(_DIFF_SEPARATOR)
+    if first == -1:
+        return output.strip(), "(No diff found)", ()
+
+    # Each section starts right after "diff --git ", e.g. "a/foo.py b/foo.py\n...".
+    paths = []
+    start = first
+    while start != -1:
+        section = start + len(_DIFF_SEPARATOR)
+        if output.startswith("a/", section):
+            eol = output.find("\n", section)
+            end = output.find(" b/", section + 2, eol if eol != -1 else len(output))
+            if end > section + 2:
+                paths.append(output[section + 2 : end])
+        start = output.find(_DIFF_SEPARATOR, section)
+
+    diff_end = len(output)
+    while diff_end > first and output[diff_end - 1].isspace():
+        diff_end -= 1
+
+    return output[:first].strip(), output[first + 1 : diff_end], tuple(paths)
+
 
 class CommitHandler(RequestHandler):
     """Serves detailed information about a single commit using `git show` and tag context."""
 
-    repo_path: str
+    repo_path: Path
+    tag_pattern: str
+    store: Optional[CommitMetadataStore]
 
     def initialize(self):
-        """Store the repo path for subprocess calls to Git."""
+        """Store the repo path, tag pattern and metadata store used on every request."""
         self.repo_path = self.application.settings.get("repo_path")
+        self.tag_pattern = self.application.settings["tag_pattern"]
+        self.store = self.application.settings.get("commit_metadata_store")
 
     def data_received(self, chunk):
         pass  # Required by base class, not used
 
-    def find_closest_tags(self, sha):
+    async def find_closest_tags(self, sha):
         """
         Combine `follows` and `precedes` lookups into a single call.
         Returns a tuple: (follows_info, precedes_info)
+
+        Both lookups run git synchronously, so they are pushed onto the default executor
+        to keep the IOLoop free while they run, each holding one of the async git slots.
         """
-        pattern = self.application.settings["tag_pattern"]
-        follows = find_follows_tag(sha, self.repo_path, pattern)
-        precedes = find_precedes_tag(sha, self.repo_path, pattern)
+        pattern = self.tag_pattern
+        follows, precedes = await multi(
+            [
+                run_in_git_slot(find_follows_tag, sha, self.repo_path, pattern),
+                run_in_git_slot(find_precedes_tag, sha, self.repo_path, pattern),
+            ]
+        )
         return follows, precedes
 
-    def get_describe_name(self, sha):
-        pattern = self.application.settings["tag_pattern"]
-        describe_name = get_describe_name(self.repo_path, sha, pattern)
-        return describe_name
+    async def get_describe_name(self, sha):
+        return await get_describe_name_async(self.repo_path, sha, self.tag_pattern)
 
-    def get(self, sha):
+    async def load_parents_and_children(self, sha) -> Tuple[list, list]:
         """
-        Render the commit detail view for the given SHA, including:
-        - `git show` output
-        - Nearest previous and next tags matching the filter pattern
+        Return (parents, children) for sha, or two empty lists if git cannot resolve it.
+
+        The commit graph behind this is rebuilt with `rev-list --all` after HEAD moves, so
+        the lookup runs on the executor rather than the IOLoop.
         """
         try:
-            result = run_git(self.repo_path, "show", sha, check=True)
+            return await run_in_git_slot(get_commit_parents_and_children, sha, self.repo_path)
+        except subprocess.CalledProcessError as e:
+            logger.error("parent lookup failed for %s: %s", sha, e.stderr)
+            return [], []
+
+    async def load_show(self, sha) -> Optional[Tuple[str, str, Tuple[str, ...]]]:
+        """
+        Return the parsed `git show` output for sha, or None if git produced nothing.
+
+        Full 40-character SHAs are served from an LRU cache; other revisions can move
+        and are always re-read.
+        """
+        cacheable = _FULL_SHA_RE.fullmatch(sha) is not None
+        key = (self.repo_path, sha)
+        if cacheable and key in _SHOW_CACHE:
+            _SHOW_CACHE.move_to_end(key)
+            return _SHOW_CACHE[key]
+
+        try:
+            result = await run_git_async(self.repo_path, "show", sha, check=True)
             output = result.stdout
         except subprocess.CalledProcessError as e:
             logger.error("git show failed for %s: %s", sha, e.stderr)
@@ -71,55 +142,49 @@ class CommitHandler(RequestHandler):
             output = None
 
         if not output:
+            return None
+
+        shown = _split_show_output(output)
+        if cacheable:
+            _SHOW_CACHE[key] = shown
+            if len(_SHOW_CACHE) > _SHOW_CACHE_MAX:
+                _SHOW_CACHE.popitem(last=False)
+        return shown
+
+    async def get(self, sha):
+        """
+        Render the commit detail view for the given SHA, including:
+        - `git show` output
+        - Nearest previous and next tags matching the filter pattern
+        """
+        # The show, tag, describe and parent/child lookups are independent; wait on them together.
+        shown, (follows, precedes), describe_name, (parents, children) = await multi(
+            [
+                self.load_show(sha),
+                self.find_closest_tags(sha),
+                self.get_describe_name(sha),
+                self.load_parents_and_children(sha),
+            ]
+        )
+        if shown is None:
             self.set_status(500)
             self.write("No output from git show; see logs for details.")
             return
-
-        follows, precedes = self.find_closest_tags(sha)
-        describe_name = self.get_describe_name(sha)
-
-        parents, children = get_commit_parents_and_children(sha, self.repo_path)
-
-        store = self.application.settings.get("commit_metadata_store")
+        header, output_diff, paths = shown
 
         commit_row = None
-        if store is not None:
-            store.reload()
-            commit_row = store.get_row(sha)
+        if self.store is not None:
+            self.store.reload()
+            commit_row = self.store.get_row(sha)
 
         if commit_row is None:
             commit_row = {"sha": sha, "issue": "", "release": ""}
 
-        split_index = output.find("diff --git")
-        if split_index == -1:
-            output_diff = "(No diff found)"
-            header = output.strip()
-        else:
-            header = output[:split_index].strip()
-            output_diff = output[split_index:].strip()
-
-        # Extract paths from diff headers like: diff --git a/foo.py b/foo.py
-        diff_lines = output_diff.splitlines()
-        paths = []
-
-        for line in diff_lines:
-            if line.startswith("diff --git"):
-                match = re.match(r"diff --git a/(.*?) b/", line)
-                if match:
-                    paths.append(match.group(1))
-
         suggestion_result = compute_issue_suggestion(self.repo_path, header, touched_paths=paths)
         existing_issues = suggestion_result.existing_issues
 
-        raw_issue = commit_row.get("issue", "")
-        if isinstance(raw_issue, str):
-            issue_value = raw_issue
-        elif raw_issue is None:
-            issue_value = ""
-        elif isinstance(raw_issue, float) and math.isnan(raw_issue):
-            issue_value = ""
-        else:
-            issue_value = str(raw_issue)
+        # The stores normalize issue/release to strings at load, so no NaN handling is needed here.
+        issue_value = commit_row.get("issue") or ""
         commit_row["issue"] = issue_value
         issue_suggestion = None
         issue_suggestion_source: Optional[str] = None
@@ -134,15 +199,7 @@ class CommitHandler(RequestHandler):
             issue_value = issue_suggestion
             issue_prefilled = True
 
-        raw_release = commit_row.get("release", "")
-        if isinstance(raw_release, str):
-            release_value = raw_release.strip()
-        elif raw_release is None:
-            release_value = ""
-        elif isinstance(raw_release, float):
-            release_value = "" if math.isnan(raw_release) else str(raw_release)
-        else:
-            release_value = str(raw_release)
+        release_value = (commit_row.get("release") or "").strip()
         commit_row["release"] = release_value
 
         release_result = compute_release_suggestion(
@@ -150,7 +207,7 @@ class CommitHandler(RequestHandler):
             sha,
             current_release=release_value,
             precedes=precedes,
-            tag_pattern=self.application.settings["tag_pattern"],
+            tag_pattern=self.tag_pattern,
         )
         release_suggestion = release_result.suggestion
         release_suggestion_source = release_result.suggestion_source
@@ -191,7 +248,7 @@ class CommitHandler(RequestHandler):
         Returns:
             True if the tag matches the pattern; False otherwise.
         """
-        return fnmatch.fnmatch(tag, self.application.settings["tag_pattern"])
+        return fnmatch.fnmatch(tag, self.tag_pattern)
 
 
 class CommitResolveHandler(RequestHandler):
@@ -201,11 +258,17 @@ class CommitResolveHandler(RequestHandler):
     and redirects to the canonical /commit/<full_sha> URL.
     """
 
+    repo_path: Path
+
+    def initialize(self):
+        self.repo_path = self.application.settings.get("repo_path")
+
     def get(self, rev_input: str):
         """
         Handle GET /commit/<rev>.
 
-        Resolves <rev> using `git rev-parse`, then redirects the client
+        Resolves <rev> through the repository's persistent
+        `git cat-file --batch-check` session, then redirects the client
         to /commit/<full_sha>. If the revision cannot be resolved, a 404
         is returned. Redirect is temporary (302) to avoid client-side
         caching during development.
@@ -219,10 +282,14 @@ class CommitResolveHandler(RequestHandler):
         #   multiple path segments, but keep *some* cap in place for safety.
         rev = rev_input[:255]
 
-        try:
-            result = run_git(self.application.settings["repo_path"], "rev-parse", rev)
-            full_sha = result.stdout.strip()
-        except subprocess.CalledProcessError as err:
-            raise HTTPError(404, f"Revision {rev_input} not found") from err
+        # Lowercase 40-hex SHAs are routed straight to CommitHandler; any other casing of a
+        # full SHA only needs normalising, not a trip to git.
+        if len(rev) == 40 and _FULL_SHA_RE.fullmatch(rev.lower()):
+            self.redirect(f"/commit/{rev.lower()}", permanent=True)
+            return
+
+        full_sha = get_git_session(self.repo_path).resolve_commit(rev)
+        if full_sha is None:
+            raise HTTPError(404, f"Revision {rev_input} not found")
 
         self.redirect(f"/commit/{full_sha}", permanent=True)
@@ -8,30 +8,34 @@ from urllib.parse import quote
 from tornado.web import HTTPError, RequestHandler
 
 from ..utils.git import extract_commits_from_git
-from ..utils.issues import find_commits_referring_to_issue
+from ..utils.issues import find_rows_referring_to_issue, issue_files
+from ..utils.metadata_store import CommitMetadataStore
 
 logger = logging.getLogger(__name__)
 # logger.addHandler(logging.NullHandler())  # safe default
 
 
 def find_issue_file(slug: str, issues_dir: Path) -> Path | None:
-    for subdir in ("open", "closed"):
-        path = issues_dir / subdir / f"{slug}.md"
-        if path.exists():
-            return path
-    return None
+    """Return the issue file for slug under issues_dir/open or issues_dir/closed (open wins)."""
+    return issue_files(issues_dir).get(slug)
 
 
 class IssueDetailHandler(RequestHandler):
+    repo_path: Path
+    issues_dir: Path
+    store: CommitMetadataStore
+
+    def initialize(self):
+        self.repo_path = self.application.settings["repo_path"]
+        self.issues_dir = self.application.settings["issues_dir"]
+        self.store = self.application.settings.get("commit_metadata_store")
+
     def get(self, slug):
         """
         Look for the issue in issues/open/ or issues/closed/
         Render issue.html with its content.
         """
-        repo_path: Path = self.application.settings["repo_path"]
-        issues_dir: Path = self.application.settings["issues_dir"]
-
-        path = find_issue_file(slug, issues_dir)
+        path = find_issue_file(slug, self.issues_dir)
         if path is None:
             raise HTTPError(404, f"Issue {slug} not found in open/ or closed/")
 
@@ -39,29 +43,32 @@ class IssueDetailHandler(RequestHandler):
             content = f.read()
         status = path.parent.name
 
-        commit_metadata_store = self.application.settings.get("commit_metadata_store")
-        linked_commits = []
-
         # Refresh store (no-op for in-memory stores), then ask it for SHAs
         try:
-            commit_metadata_store.reload()
+            self.store.reload()
         except Exception as e:
             logger.warning("Failed to reload commit metadata store: %s", e)
-        sha_list = commit_metadata_store.shas_for_issue(slug)
+        sha_list = self.store.shas_for_issue(slug)
 
-        # Scan all commits and filter only those matching spreadsheet-linked SHAs
-        scanned_commits = [SimpleNamespace(**row) for row in extract_commits_from_git(repo_path)]
+        # Scan all commits and filter only those matching spreadsheet-linked SHAs.
+        # Rows stay plain dicts until the final merged list is handed to the template.
+        scanned_rows = extract_commits_from_git(self.repo_path)
 
-        linked_commits = [row for row in scanned_commits if row.sha in sha_list]
+        sha_set = set(sha_list)
+        linked_rows = [row for row in scanned_rows if row["sha"] in sha_set]
 
         logger.debug("linked_commits: %s", sha_list)
 
-        referring = find_commits_referring_to_issue(slug, scanned_commits)
+        referring = find_rows_referring_to_issue(slug, scanned_rows)
 
         # Merge in any inferred rows not already included
+        seen = {row["sha"] for row in linked_rows}
         for row in referring:
-            if row.sha not in {c.sha for c in linked_commits}:
-                linked_commits.append(row)
+            if row["sha"] not in seen:
+                linked_rows.append(row)
+                seen.add(row["sha"])
+
+        linked_commits = [SimpleNamespace(**row) for row in linked_rows]
 
         self.render(
             "issue.html",
@@ -99,11 +106,15 @@ def normalize_to(s: str, target_eol: str) -> str:
 
 
 class IssueUpdateHandler(RequestHandler):
+    issues_dir: Path
+
+    def initialize(self):
+        self.issues_dir = self.application.settings["issues_dir"]
+
     def post(self, slug: str):
-        issues_dir: Path = self.application.settings["issues_dir"]
         markdown = self.get_body_argument("markdown")
 
-        path = find_issue_file(slug, issues_dir)
+        path = find_issue_file(slug, self.issues_dir)
         if path is None:
             self.set_status(404)
             self.write("Issue not found.")
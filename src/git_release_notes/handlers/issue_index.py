@@ -6,6 +6,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from datetime import datetime, timezone
+from pathlib import Path
 from typing import Iterable
 from urllib.parse import urlencode
 
@@ -72,7 +73,7 @@ def _sort_rows(rows: Iterable[IssueIndexRow], sort_mode: str) -> list[IssueIndex
 class IssueIndexHandler(RequestHandler):
     """Render the issue index page with release and landing metadata."""
 
-    repo_path: str
+    repo_path: Path
     issues_dir: str
     store: CommitMetadataStore
 
@@ -6,28 +6,48 @@ and passes it to the template for interactive browsing.
 """
 
 import logging
-import math
+import os
+from pathlib import Path
 
 from tornado.web import RequestHandler
 
-from ..utils.git import extract_commits_from_git, run_git
-from ..utils.issue_suggestions import compute_issue_suggestion
+from ..utils.git import (
+    batch_touched_paths,
+    extract_commits_from_git,
+    get_ref_state,
+    ref_state_is_settled,
+    run_git,
+)
+from ..utils.issue_suggestions import compute_issue_suggestion, existing_issue_slugs
 from ..utils.metadata_store import CommitMetadataStore
 from ..utils.release_suggestions import compute_release_suggestion
 
 logger = logging.getLogger(__name__)
 
 
+# The spreadsheet columns index.html reads; other columns of a wide workbook are not copied into rows.
+_INDEX_COLUMNS = ("sha", "message", "author_date", "issue", "release", "touched_paths")
+
+
+def _index_records(df) -> list[dict]:
+    """Build one row dict per spreadsheet row from whole-column lists instead of to_dict(orient="records")."""
+    columns = [column for column in _INDEX_COLUMNS if column in df.columns]
+    column_values = (df[column].tolist() for column in columns)
+    return [dict(zip(columns, values, strict=True)) for values in zip(*column_values, strict=True)]
+
+
 class MainHandler(RequestHandler):
     """Serves the main page showing a table of commits loaded from the spreadsheet."""
 
-    repo_path: str
+    repo_path: Path
     store: CommitMetadataStore
+    tag_pattern: str
 
     def initialize(self):
         """Inject the preloaded DataFrame of commit metadata into the handler."""
         self.repo_path = self.application.settings.get("repo_path")
         self.store = self.application.settings.get("commit_metadata_store")
+        self.tag_pattern = self.application.settings.get("tag_pattern", "rel-*")
 
     def data_received(self, chunk):
         pass  # Required by base class, not used
@@ -38,41 +58,56 @@ class MainHandler(RequestHandler):
 
         Passes the full commit metadata DataFrame (as a list of dicts) to the template
         for rendering as an interactive HTML table.
+
+        The rows are reused across requests while everything they are derived from is
+        unchanged: the store's contents, HEAD and the tag refs, and the set of issue files.
         """
+        ref_state = get_ref_state(self.repo_path)
+        key = (self.store.version, ref_state, existing_issue_slugs(os.fspath(self.repo_path)))
+
+        cached = self.application.settings.get("index_rows_cache")
+        if cached is not None and cached[0] == key:
+            rows = cached[1]
+        else:
+            rows = self._build_rows()
+            if ref_state_is_settled(ref_state):
+                self.application.settings["index_rows_cache"] = (key, rows)
 
-        metadata_df = self.store.get_metadata_df()
+        self.render("index.html", rows=rows)
 
+    def _build_rows(self) -> list[dict]:
+        """Assemble the index rows with their issue and release suggestions."""
         if self.store.limits_commit_set():
-            rows = metadata_df.to_dict(orient="records")
+            rows = _index_records(self.store.get_metadata_df())
         else:
             git_rows = extract_commits_from_git(self.repo_path)
 
             logger.info("Extracted %d git commits", len(git_rows))
-            for row in git_rows:
-                logger.info("GIT SHA: %s — %s", row["sha"], row["message"])
-
-            if not metadata_df.empty:
-                metadata = metadata_df.set_index("sha").to_dict(orient="index")
-            else:
-                metadata = {}
-
-            logger.info("Metadata rows: %d", len(metadata_df))
-            for sha in metadata_df["sha"]:
-                logger.info("META SHA: %s", sha)
-
-            # Merge
+            if logger.isEnabledFor(logging.DEBUG):
+                for row in git_rows:
+                    logger.debug("GIT SHA: %s — %s", row["sha"], row["message"])
+                metadata_df = self.store.get_metadata_df()
+                logger.debug("Metadata rows: %d", len(metadata_df))
+                for sha in metadata_df["sha"]:
+                    logger.debug("META SHA: %s", sha)
+
+            # Merge through the store's cached SHA index rather than re-indexing the frame.
             rows = []
             for row in git_rows:
-                sha = row["sha"]
-                meta = metadata.get(sha, {})
+                meta = self.store.get_row(row["sha"]) or {}
                 row["issue"] = meta.get("issue", "")
                 row["release"] = meta.get("release", "")
                 rows.append(row)
 
-        tag_pattern = self.application.settings.get("tag_pattern", "rel-*")
+        # One git call covers every row without precomputed paths (spreadsheet rows).
+        batched_paths = batch_touched_paths(
+            self.repo_path, [row["sha"] for row in rows if row.get("touched_paths") is None]
+        )
 
         for row in rows:
             touched_paths = row.get("touched_paths")
+            if touched_paths is None:
+                touched_paths = batched_paths.get(row["sha"])
             if touched_paths is None:
                 touched_paths = self._get_touched_paths(row["sha"])
 
@@ -87,22 +122,14 @@ class MainHandler(RequestHandler):
             row["issue_suggestion"] = suggestion_value
             row["issue_suggestion_source"] = suggestion.suggestion_source if suggestion_value else None
 
-            raw_release = row.get("release", "")
-            if isinstance(raw_release, str):
-                release_value = raw_release.strip()
-            elif raw_release is None:
-                release_value = ""
-            elif isinstance(raw_release, float):
-                release_value = "" if math.isnan(raw_release) else str(raw_release)
-            else:
-                release_value = str(raw_release)
+            release_value = (row.get("release") or "").strip()
             row["release"] = release_value
 
             release_suggestion = compute_release_suggestion(
                 self.repo_path,
                 row["sha"],
                 current_release=release_value,
-                tag_pattern=tag_pattern,
+                tag_pattern=self.tag_pattern,
             )
             if release_suggestion.suggestion:
                 row["release_suggestion"] = release_suggestion.suggestion
@@ -114,9 +141,9 @@ class MainHandler(RequestHandler):
                 row["release_suggestion_source"] = None
                 row["release_suggestion_label"] = None
 
-        self.render("index.html", rows=rows)
+        return rows
 
     def _get_touched_paths(self, sha: str) -> list[str]:
-        """Retrieve touched paths for commits lacking precomputed file lists."""
+        """Retrieve touched paths for one commit the batched lookup could not resolve."""
         result = run_git(self.repo_path, "show", "--name-only", "--pretty=format:", sha, check=True)
         return [line.strip() for line in result.stdout.splitlines() if line.strip()]
@@ -11,17 +11,19 @@ from __future__ import annotations
 import logging
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Iterable
+from typing import Iterable, Mapping
 
 from tornado.web import HTTPError, RequestHandler
 
 from ..utils.git import (
+    batch_commit_meta,
     find_follows_tag,
     find_precedes_tag,
     get_matching_tag_commits,
     run_git,
 )
-from .issue import find_issue_file
+from ..utils.issues import issue_files
+from ..utils.metadata_store import CommitMetadataStore
 
 logger = logging.getLogger(__name__)
 
@@ -71,11 +73,10 @@ def _resolve_tag_metadata(
     if not commits:
         return None
 
-    repo = str(repo_path)
     sha = commits[0].sha
     short_sha = commits[0].short_sha
 
-    tag_map = get_matching_tag_commits(repo, tag_pattern)
+    tag_map = get_matching_tag_commits(repo_path, tag_pattern)
     direct_tag = tag_map.get(sha)
     if direct_tag:
         return {
@@ -87,8 +88,8 @@ def _resolve_tag_metadata(
             "next": None,
         }
 
-    previous = find_follows_tag(sha, repo, tag_pattern)
-    next_tag = find_precedes_tag(sha, repo, tag_pattern)
+    previous = find_follows_tag(sha, repo_path, tag_pattern)
+    next_tag = find_precedes_tag(sha, repo_path, tag_pattern)
 
     if previous is None and next_tag is None:
         return None
@@ -112,8 +113,8 @@ def _extract_heading(markdown: str) -> str | None:
     return None
 
 
-def _load_issue_entry(slug: str, issues_dir: Path) -> ReleaseIssue:
-    path = find_issue_file(slug, issues_dir)
+def _load_issue_entry(slug: str, issue_paths: Mapping[str, Path]) -> ReleaseIssue:
+    path = issue_paths.get(slug)
     if path is None:
         return ReleaseIssue(slug=slug, status=None, title=None, path=None)
 
@@ -182,26 +183,46 @@ def _collect_release_groups(records: Iterable[dict]) -> dict[str, dict]:
     return releases
 
 
+def _release_groups(settings: dict, store: CommitMetadataStore) -> dict[str, dict]:
+    """
+    Reload the store and return its rows grouped by release.
+
+    The grouping is shared by both release views and rebuilt only when the store's
+    version moves (an edit, or a reload that re-read the file). Treat it as read-only.
+    """
+    try:
+        store.reload()
+    except Exception as exc:  # pragma: no cover - defensive
+        logger.warning("Failed to reload commit metadata store: %s", exc)
+
+    cached = settings.get("release_groups_cache")
+    if cached is not None and cached[0] is store and cached[1] == store.version:
+        return cached[2]
+
+    df = store.get_metadata_df()
+    records = df.to_dict(orient="records") if not df.empty else []
+    releases = _collect_release_groups(records)
+    settings["release_groups_cache"] = (store, store.version, releases)
+    return releases
+
+
 class ReleaseIndexHandler(RequestHandler):
     """Render a list of releases with high-level counts."""
 
-    def get(self):
-        store = self.application.settings.get("commit_metadata_store")
-        issues_dir: Path = self.application.settings.get("issues_dir")
+    store: CommitMetadataStore
+    issues_dir: Path
 
-        try:
-            store.reload()
-        except Exception as exc:  # pragma: no cover - defensive
-            logger.warning("Failed to reload commit metadata store: %s", exc)
+    def initialize(self):
+        self.store = self.application.settings.get("commit_metadata_store")
+        self.issues_dir = self.application.settings.get("issues_dir")
 
-        df = store.get_metadata_df()
-        records = df.to_dict(orient="records") if not df.empty else []
-
-        releases = _collect_release_groups(records)
+    def get(self):
+        releases = _release_groups(self.application.settings, self.store)
 
+        issue_paths = issue_files(self.issues_dir)
         release_rows = []
         for release_slug, bucket in sorted(releases.items()):
-            issue_entries = [_load_issue_entry(slug, issues_dir) for slug in sorted(bucket["issues"])]
+            issue_entries = [_load_issue_entry(slug, issue_paths) for slug in sorted(bucket["issues"])]
             release_rows.append(
                 {
                     "slug": release_slug,
@@ -219,41 +240,46 @@ class ReleaseIndexHandler(RequestHandler):
 class ReleaseDetailHandler(RequestHandler):
     """Render an individual release with its commits and linked issues."""
 
-    def get(self, release_slug: str):
-        store = self.application.settings.get("commit_metadata_store")
-        repo_path: Path = self.application.settings.get("repo_path")
-        issues_dir: Path = self.application.settings.get("issues_dir")
-        tag_pattern: str = self.application.settings.get("tag_pattern", "rel-*")
+    store: CommitMetadataStore
+    repo_path: Path
+    issues_dir: Path
+    tag_pattern: str
 
-        try:
-            store.reload()
-        except Exception as exc:  # pragma: no cover - defensive
-            logger.warning("Failed to reload commit metadata store: %s", exc)
+    def initialize(self):
+        self.store = self.application.settings.get("commit_metadata_store")
+        self.repo_path = self.application.settings.get("repo_path")
+        self.issues_dir = self.application.settings.get("issues_dir")
+        self.tag_pattern = self.application.settings.get("tag_pattern", "rel-*")
 
-        df = store.get_metadata_df()
-        records = df.to_dict(orient="records") if not df.empty else []
-
-        releases = _collect_release_groups(records)
+    def get(self, release_slug: str):
+        releases = _release_groups(self.application.settings, self.store)
         if release_slug not in releases:
             raise HTTPError(404, f"Release {release_slug} not found")
 
         bucket = releases[release_slug]
 
+        issue_paths = issue_files(self.issues_dir)
         issue_entries = []
         for slug in sorted(bucket["issues"]):
-            entry = _load_issue_entry(slug, issues_dir)
+            entry = _load_issue_entry(slug, issue_paths)
             issue_entries.append(entry)
 
+        # One git call formats every commit; per-SHA `git show` is only the fallback.
+        commit_meta = batch_commit_meta(self.repo_path, bucket["commits"])
         commits: list[ReleaseCommit] = []
         for sha, info in bucket["commits"].items():
-            commit_entry = _load_commit_entry(repo_path, sha, info.get("issue", ""))
+            meta = commit_meta.get(sha)
+            if meta is not None:
+                commit_entry = ReleaseCommit(**meta, issue=info.get("issue", ""))
+            else:
+                commit_entry = _load_commit_entry(self.repo_path, sha, info.get("issue", ""))
             if commit_entry:
                 commits.append(commit_entry)
 
         commits.sort(key=lambda commit: commit.author_date, reverse=True)
 
         summary = _build_summary(issue_entries, commits)
-        tag_metadata = _resolve_tag_metadata(repo_path, commits, tag_pattern)
+        tag_metadata = _resolve_tag_metadata(self.repo_path, commits, self.tag_pattern)
 
         self.render(
             "release-detail.html",
@@ -2,7 +2,8 @@
 UpdateCommitHandler: Handles POST updates to commit metadata.
 
 Supports in-memory editing of 'issue' and 'release' fields and writes changes
-back to the spreadsheet using an atomic Excel save.
+back to the spreadsheet using an atomic Excel save, debounced so that a burst
+of edits costs a single write.
 """
 
 import logging
@@ -16,13 +17,17 @@ logger.addHandler(logging.NullHandler())  # safe default
 class UpdateCommitHandler(RequestHandler):
     """Handles updates to commit metadata submitted via POST."""
 
+    def initialize(self):
+        self.store = self.application.settings.get("commit_metadata_store")
+        self.save_delay = self.application.settings.get("metadata_save_delay", 0.0)
+
     def post(self, sha):
         """
         Update the 'issue' field for a commit in the spreadsheet.
 
         Expects a form field named 'issue' and a valid commit SHA in the URL.
         Locates the corresponding row in the loaded spreadsheet, updates the
-        'issue' field in-memory, and overwrites the spreadsheet on disk.
+        'issue' field in-memory, and schedules a debounced save to disk.
 
         Responds with:
         - 500 if no spreadsheet is loaded
@@ -34,24 +39,26 @@ class UpdateCommitHandler(RequestHandler):
         # handlers/update.py (inside post)
         is_ajax = self.request.headers.get("X-Requested-With") == "fetch" or self.get_argument("ajax", None)
 
-        store = self.application.settings.get("commit_metadata_store")
-        if store is None:
+        if self.store is None:
             raise HTTPError(500, "No commit metadata store configured")
 
         try:
             if "issue" in self.request.body_arguments:
                 new_issue = self.get_argument("issue", "").strip()
-                store.set_issue(sha, new_issue)
+                self.store.set_issue(sha, new_issue)
 
             if "release" in self.request.body_arguments:
                 new_release = self.get_argument("release", "").strip()
-                store.set_release(sha, new_release)
-
-            store.save()
+                self.store.set_release(sha, new_release)
 
         except KeyError as e:
             raise HTTPError(404, str(e)) from e
 
+        # After a failed deferred save, save inline so the error reaches this client as a
+        # 500 instead of the edit being reported as saved; success clears the failure.
+        delay = 0.0 if self.store.last_save_error is not None else self.save_delay
+        self.store.save_soon(delay)
+
         if is_ajax:
             self.set_status(204)
             return
@@ -47,16 +47,11 @@ SLUG_RE = re.compile(
 
 
 def extract_issue_slugs(message: str) -> tuple[str | None, list[str]]:
-    directive_matches = list(DIRECTIVE_RE.finditer(message))
-    logger.debug("directive_matches={}".format((directive_matches,)))
-    directive_match = min(directive_matches, key=lambda m: m.start()) if directive_matches else None
+    # The leftmost directive is the primary one, so the first search hit is enough.
+    directive_match = DIRECTIVE_RE.search(message)
+    logger.debug("directive_match=%r", directive_match)
     primary = directive_match.group("slug") if directive_match else None
 
-    all_matches = []
-    for m in SLUG_RE.finditer(message):
-        for val in m.groups():
-            if val:
-                all_matches.append(val)
-                break
-
-    return primary, list(dict.fromkeys(all_matches))
+    # Exactly one alternative of SLUG_RE matches, and lastgroup names it.
+    slugs = dict.fromkeys(m.group(m.lastgroup) for m in SLUG_RE.finditer(message))
+    return primary, list(slugs)
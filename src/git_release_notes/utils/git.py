@@ -6,17 +6,36 @@ Includes:
 - get_commit_parents_and_children: Return the parent and child SHAs for a given commit.
 """
 
+import atexit
 import fnmatch
 import logging
+import os
 import re
 import subprocess
+import threading
+import time
 from collections import defaultdict
+from datetime import timedelta
 from functools import lru_cache
 from time import perf_counter
 from types import SimpleNamespace
-from typing import Dict, List, Tuple
+from typing import Callable, Dict, Iterable, List, Tuple, TypeVar
+
+from tornado.gen import TimeoutError as GenTimeoutError
+from tornado.gen import multi, with_timeout
+from tornado.ioloop import IOLoop
+from tornado.locks import Semaphore
+from tornado.process import Subprocess
+
+from .mtime import is_settled, mtime_or_missing
 
 logger = logging.getLogger(__name__)
+T = TypeVar("T")
+
+#: Repository paths arrive as pathlib.Path from the app settings and as str elsewhere. Entry
+#: points that key a session or cache on the path normalize it with os.fspath() first, so
+#: both spellings share one cat-file process and one set of cached answers.
+StrPath = str | os.PathLike[str]
 
 
 def run_git(repo_path: str, *args: str, **kwargs) -> subprocess.CompletedProcess:
@@ -36,6 +55,146 @@ def run_git(repo_path: str, *args: str, **kwargs) -> subprocess.CompletedProcess
     return cp
 
 
+# Caps concurrent git children spawned from the IOLoop so a burst of requests can't fork-storm.
+# Roughly three quarters of the CPUs, within [2, 32], leaves room for the server itself.
+_git_async_slots = Semaphore(max(2, min(32, (os.cpu_count() or 4) * 3 // 4)))
+
+
+async def run_git_async(
+    repo_path: str, *args: str, check: bool = False, timeout: float | None = 30.0
+) -> subprocess.CompletedProcess:
+    """
+    IOLoop-friendly counterpart to run_git.
+
+    Streams stdout/stderr through tornado.process.Subprocess so other requests keep
+    being served while git runs. Returns CompletedProcess and raises
+    CalledProcessError on non-zero exit when check=True, mirroring run_git.
+    A git that outlives timeout seconds is killed and TimeoutExpired is raised.
+    """
+    cmd = ["git", *args]
+    async with _git_async_slots:
+        start = perf_counter()
+        proc = Subprocess(cmd, cwd=repo_path, stdout=Subprocess.STREAM, stderr=Subprocess.STREAM)
+        output = multi([proc.stdout.read_until_close(), proc.stderr.read_until_close()])
+        try:
+            if timeout is None:
+                stdout, stderr = await output
+            else:
+                stdout, stderr = await with_timeout(timedelta(seconds=timeout), output)
+        except GenTimeoutError:
+            proc.proc.kill()
+            await proc.wait_for_exit(raise_error=False)
+            raise subprocess.TimeoutExpired(cmd, timeout) from None
+        returncode = await proc.wait_for_exit(raise_error=False)
+
+    dt_ms = (perf_counter() - start) * 1000.0
+    _record_git_stat(args, dt_ms)
+    _maybe_log_slow(args, dt_ms)
+
+    cp = subprocess.CompletedProcess(cmd, returncode, stdout.decode("utf-8"), stderr.decode("utf-8"))
+    if check:
+        cp.check_returncode()
+    return cp
+
+
+async def run_in_git_slot(func: Callable[..., T], *args) -> T:
+    """
+    Run func(*args), a synchronous helper that shells out to git, on the default executor.
+
+    The call holds one of the slots run_git_async draws from, so executor-side git work
+    counts toward the same cap on concurrent git children.
+    """
+    async with _git_async_slots:
+        return await IOLoop.current().run_in_executor(None, func, *args)
+
+
+class GitBatchSession:
+    """
+    Long-lived `git cat-file --batch-check` process for one repository.
+
+    Resolving a revision writes one line to the process and reads one line back, so
+    repeated lookups skip the fork/exec and ref loading a `git rev-parse` call pays.
+    """
+
+    _ARGS = ("cat-file", "--batch-check")
+
+    def __init__(self, repo_path: str):
+        self.repo_path = repo_path
+        self._proc: subprocess.Popen | None = None
+        # Request handlers may resolve from executor threads; one request/response at a time.
+        self._lock = threading.Lock()
+
+    def _ensure_process(self) -> subprocess.Popen:
+        if self._proc is None or self._proc.poll() is not None:
+            self._proc = subprocess.Popen(
+                ["git", *self._ARGS],
+                cwd=self.repo_path,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                text=True,
+                bufsize=1,
+            )
+        return self._proc
+
+    def resolve_commit(self, rev: str) -> str | None:
+        """Return the full SHA of the commit rev names (tags are peeled), or None."""
+        if not rev or "\n" in rev or "\r" in rev:
+            return None
+
+        start = perf_counter()
+        line = ""
+        with self._lock:
+            for _attempt in range(2):
+                proc = self._ensure_process()
+                try:
+                    proc.stdin.write(f"{rev}^{{commit}}\n")
+                    proc.stdin.flush()
+                    line = proc.stdout.readline()
+                except (BrokenPipeError, OSError):
+                    line = ""
+                if line:
+                    break
+                # The process went away underneath us; start a fresh one and retry once.
+                self.close()
+
+        dt_ms = (perf_counter() - start) * 1000.0
+        _record_git_stat(self._ARGS, dt_ms)
+        _maybe_log_slow(self._ARGS, dt_ms)
+
+        parts = line.split()
+        if len(parts) == 3 and parts[1] == "commit":
+            return parts[0]
+        return None
+
+    def close(self) -> None:
+        if self._proc is not None:
+            if self._proc.stdin:
+                self._proc.stdin.close()
+            self._proc.kill()
+            self._proc.wait()
+            self._proc = None
+
+
+_git_sessions: Dict[str, GitBatchSession] = {}
+
+
+def get_git_session(repo_path: StrPath) -> GitBatchSession:
+    """Return the shared GitBatchSession for repo_path, creating it on first use."""
+    repo_path = os.fspath(repo_path)
+    session = _git_sessions.get(repo_path)
+    if session is None:
+        session = _git_sessions[repo_path] = GitBatchSession(repo_path)
+    return session
+
+
+@atexit.register
+def _close_git_sessions() -> None:
+    for session in _git_sessions.values():
+        session.close()
+    _git_sessions.clear()
+
+
 _git_stats: Dict[Tuple[str, ...], Dict[str, float]] = defaultdict(
     lambda: {"count": 0, "total_ms": 0.0, "max_ms": 0.0}
 )
@@ -73,13 +232,33 @@ def reset_git_stats() -> None:
     _git_stats.clear()
 
 
-def extract_commits_from_git(repo_path: str) -> list[dict]:
+def extract_commits_from_git(repo_path: StrPath) -> list[dict]:
     """
     Extract commit metadata directly from the Git repository.
 
     Returns a list of dictionaries with keys:
     id, sha, release, message, author_date, and touched_paths.
+
+    The parsed log is cached until HEAD moves; every call gets its own row dicts and
+    path lists, so callers may mutate them freely.
     """
+    repo_path = os.fspath(repo_path)
+    head = get_git_session(repo_path).resolve_commit("HEAD")
+    if head is None:
+        return _extract_commits(repo_path)
+    return [
+        {**row, "touched_paths": list(row["touched_paths"])}
+        for row in _extract_commits_cached(repo_path, head)
+    ]
+
+
+@lru_cache(maxsize=2)
+def _extract_commits_cached(repo_path: str, head: str) -> tuple[dict, ...]:
+    """Parsed `git log` for repo_path as of head (part of the cache key only); treat as read-only."""
+    return tuple(_extract_commits(repo_path))
+
+
+def _extract_commits(repo_path: str) -> list[dict]:
     result = run_git(
         repo_path,
         "log",
@@ -135,55 +314,284 @@ def extract_commits_from_git(repo_path: str) -> list[dict]:
     return rows
 
 
-@lru_cache(maxsize=None)
-def get_commit_parents_and_children(sha: str, repo_path: str) -> Tuple[List[str], List[str]]:
+def batch_touched_paths(repo_path: str, shas: Iterable[str]) -> Dict[str, List[str]]:
     """
-    Return the parent and child SHAs for a given commit.
+    Return {full_sha: touched paths} for many commits from one `git log --no-walk --stdin`.
 
-    - Parents are obtained directly via `git show`.
-    - Children are computed by scanning `git rev-list --all --children`.
+    Paths match `git show --name-only` (merges use the same --cc combined diff). Returns
+    an empty mapping if git rejects any of the revisions, so callers should fall back
+    to per-commit lookups for SHAs that are missing from the result.
+    """
+    revs = list(dict.fromkeys(shas))
+    if not revs:
+        return {}
+    result = run_git(
+        repo_path,
+        "log",
+        "--no-walk=unsorted",
+        "--stdin",
+        "-z",
+        "--cc",
+        "--name-only",
+        "--format=%x01%H",
+        input="\n".join(revs) + "\n",
+    )
+    if result.returncode != 0:
+        logger.warning("batched touched-paths lookup failed: %s", result.stderr.strip())
+        return {}
+
+    # Each record is "\x01<sha>\0" followed by NUL-terminated paths; the first path carries
+    # the newline (or, for merges, the extra NUL) that separates it from the header.
+    touched: Dict[str, List[str]] = {}
+    for record in result.stdout.split("\x01")[1:]:
+        sha, _, rest = record.partition("\0")
+        touched[sha] = [path.strip() for path in rest.split("\0") if path.strip()]
+    return touched
 
-    Results are cached by (sha, repo_path).
+
+def batch_commit_meta(repo_path: str, revs: Iterable[str]) -> Dict[str, Dict[str, str]]:
     """
-    parents = _get_parents(sha, repo_path)
-    children = _get_children_map(repo_path).get(sha, [])
-    return parents, children
+    Return {rev: {"sha", "short_sha", "author_date", "subject"}} for many commits at once.
 
+    Revisions are resolved through the shared cat-file session first, so abbreviated SHAs
+    work and names that do not resolve to a commit are simply left out, instead of
+    failing the single `git log --no-walk --stdin` that formats the rest.
+    """
+    session = get_git_session(repo_path)
+    full_by_rev = {}
+    for rev in dict.fromkeys(revs):
+        full_sha = session.resolve_commit(rev)
+        if full_sha is not None:
+            full_by_rev[rev] = full_sha
+    if not full_by_rev:
+        return {}
 
+    result = run_git(
+        repo_path,
+        "log",
+        "--no-walk=unsorted",
+        "--stdin",
+        "--date=iso",
+        "--format=%H%x1f%h%x1f%ad%x1f%s%x1e",
+        input="\n".join(dict.fromkeys(full_by_rev.values())) + "\n",
+    )
+    if result.returncode != 0:
+        logger.warning("batched commit lookup failed: %s", result.stderr.strip())
+        return {}
+
+    by_full_sha: Dict[str, Dict[str, str]] = {}
+    for record in result.stdout.split("\x1e"):
+        fields = record.strip("\n").split("\x1f")
+        if len(fields) != 4:
+            continue
+        full_sha, short_sha, author_date, subject = fields
+        by_full_sha[full_sha] = {
+            "sha": full_sha,
+            "short_sha": short_sha,
+            "author_date": author_date,
+            "subject": subject.strip(),
+        }
+    return {rev: by_full_sha[sha] for rev, sha in full_by_rev.items() if sha in by_full_sha}
+
+
+def get_commit_parents_and_children(sha: str, repo_path: StrPath) -> Tuple[List[str], List[str]]:
+    """
+    Return the parent and child SHAs for a given commit.
+
+    Both directions come from a single `git rev-list --all --parents` scan, cached until
+    HEAD or any ref moves: a commit's parents are fixed, but new commits on any branch add
+    children to old ones. Commits newer than that scan fall back to a direct `git show`
+    for their parents.
+    """
+    repo_path = os.fspath(repo_path)
+    epoch = _refs_epoch(repo_path, "refs")
+    head = get_git_session(repo_path).resolve_commit("HEAD")
+    if is_settled(max(epoch)):
+        parents_map, children_map = _get_commit_graph(repo_path, head, epoch)
+    else:
+        parents_map, children_map = _build_commit_graph(repo_path)
+    parents = parents_map.get(sha)
+    if parents is None:
+        parents = _get_parents(sha, repo_path)
+    return parents, children_map.get(sha, [])
+
+
+@lru_cache(maxsize=1024)
 def _get_parents(sha: str, repo_path: str) -> List[str]:
     result = run_git(repo_path, "show", "-s", "--format=%P", sha, check=True)
     return result.stdout.strip().split()
 
 
-@lru_cache(maxsize=1)
-def _get_children_map(repo_path: str) -> dict:
+@lru_cache(maxsize=2)
+def _get_commit_graph(
+    repo_path: str, head: str | None, epoch: Tuple[float, float]
+) -> Tuple[Dict[str, List[str]], Dict[str, List[str]]]:
+    """Cached _build_commit_graph, rebuilt when repo_path's HEAD or ref mtimes change."""
+    return _build_commit_graph(repo_path)
+
+
+def _build_commit_graph(repo_path: str) -> Tuple[Dict[str, List[str]], Dict[str, List[str]]]:
+    """Build parent and child mappings for every commit reachable from any ref."""
+    result = run_git(repo_path, "rev-list", "--all", "--parents", check=True)
+
+    parents_map: Dict[str, List[str]] = {}
+    children_map: Dict[str, List[str]] = defaultdict(list)
+    for line in result.stdout.strip().splitlines():
+        sha, *parents = line.split()
+        parents_map[sha] = parents
+        for parent in parents:
+            children_map[parent].append(sha)
+    return parents_map, dict(children_map)
+
+
+def get_tag_commit_sha(tag: str, repo_path: str) -> str | None:
+    """Return the commit SHA tag points at (annotated tags are peeled), or None."""
+    return get_git_session(repo_path).resolve_commit(tag)
+
+
+# Follows/Precedes/describe answers for a commit only change when tags or HEAD do. Cache them
+# per (kind, repo, sha, pattern) and drop a repo's entries, along with the tag map and topo
+# order they were derived from, whenever its tag ref directories' mtimes or its HEAD commit move.
+# Results computed within the racy window of a tag change (see utils.mtime) are not stored.
+_FULL_SHA_RE = re.compile(r"[0-9a-f]{40}")
+_tag_result_cache: Dict[Tuple[str, str, str, str], object] = {}
+_tag_cache_epochs: Dict[str, Tuple[Tuple[float, float], str | None]] = {}
+_tag_cache_lock = threading.RLock()  # CommitHandler resolves Follows/Precedes on executor threads
+_MISS = object()
+
+
+@lru_cache(maxsize=32)
+def _git_common_dir(repo_path: str) -> str | None:
     """
-    Build a mapping of commit SHA to its list of children.
-    Only called once per repo_path (due to lru_cache).
+    Return the directory holding repo_path's shared refs, or None if git cannot say.
+
+    This is <repo>/.git for an ordinary checkout, but linked worktrees (where .git is a
+    file) and subdirectories of a checkout keep their tag refs elsewhere.
     """
-    result = run_git(repo_path, "rev-list", "--all", "--children", check=True)
+    result = run_git(repo_path, "rev-parse", "--path-format=absolute", "--git-common-dir")
+    if result.returncode != 0:
+        return None
+    return result.stdout.strip() or None
 
-    children_map = {}
-    for line in result.stdout.strip().splitlines():
-        parts = line.strip().split()
-        if len(parts) > 1:
-            parent, *children = parts
-            children_map[parent] = children
-    return children_map
 
+def _tag_refs_epoch(repo_path: str) -> Tuple[float, float]:
+    return _refs_epoch(repo_path, "refs/tags")
 
-def get_tag_commit_sha(tag: str, repo_path: str) -> str:
-    return run_git(
-        repo_path,
-        "rev-list",
-        "-n",
-        "1",
-        tag,
-        check=True,
-    ).stdout.strip
+
+def _refs_epoch(repo_path: str, refs_dir: str) -> Tuple[float, float]:
+    """
+    Return (newest mtime under refs_dir, packed-refs mtime) in repo_path's common git dir.
+
+    refs_dir is relative to the git dir, e.g. "refs/tags" or "refs" for every ref.
+    """
+    git_dir = _git_common_dir(repo_path)
+    epoch = (-1.0, -1.0)
+    if git_dir is not None:
+        epoch = (
+            _treemtime_or_missing(os.path.join(git_dir, *refs_dir.split("/"))),
+            mtime_or_missing(os.path.join(git_dir, "packed-refs")),
+        )
+    if max(epoch) < 0:
+        # Nothing to watch, so ref changes would go unseen: report the refs as just changed,
+        # which keeps every result inside the racy window and out of the cache.
+        now = time.time()
+        return now, now
+    return epoch
+
+
+def _treemtime_or_missing(path: str) -> float:
+    """
+    Return the newest mtime of path and every directory below it, or -1.0 if it is missing.
+
+    A hierarchical ref such as refs/tags/rel-team/2 is written into its own subdirectory,
+    which leaves the mtime of refs/tags itself untouched.
+    """
+    newest = mtime_or_missing(path)
+    if newest < 0:
+        return newest
+    for dirpath, dirnames, _ in os.walk(path):
+        for name in dirnames:
+            newest = max(newest, mtime_or_missing(os.path.join(dirpath, name)))
+    return newest
 
 
-def find_follows_tag(sha: str, repo_path: str, tag_pattern: str) -> SimpleNamespace | None:
+def get_ref_state(repo_path: StrPath) -> Tuple[Tuple[float, float], str | None]:
+    """
+    Return a cheap fingerprint of the refs views depend on: tag ref mtimes and the HEAD commit.
+
+    Equal fingerprints mean tags and HEAD have not moved, unless the tag refs changed within
+    the racy window of the read; check ref_state_is_settled before trusting equality.
+    """
+    repo_path = os.fspath(repo_path)
+    return _tag_refs_epoch(repo_path), get_git_session(repo_path).resolve_commit("HEAD")
+
+
+def ref_state_is_settled(state: Tuple[Tuple[float, float], str | None]) -> bool:
+    """True when state's tag mtimes are old enough that an equal later state means no change."""
+    return is_settled(max(state[0]))
+
+
+def clear_tag_cache(repo_path: StrPath | None = None) -> None:
+    """
+    Forget cached Follows/Precedes/describe results for repo_path (or every repo).
+
+    Call after writing tags or commits through anything other than git's own ref files.
+    """
+    if repo_path is not None:
+        repo_path = os.fspath(repo_path)
+    with _tag_cache_lock:
+        for key in [k for k in _tag_result_cache if repo_path is None or k[1] == repo_path]:
+            del _tag_result_cache[key]
+        if repo_path is None:
+            _tag_cache_epochs.clear()
+        else:
+            _tag_cache_epochs.pop(repo_path, None)
+        # Neither is keyed finely enough to evict one repo, so drop them wholesale.
+        _load_tag_commits_cached.cache_clear()
+        get_topo_ordered_commits.cache_clear()
+
+
+def _tag_cache_get(kind: str, repo_path: str, sha: str, pattern: str) -> object:
+    epoch = get_ref_state(repo_path)
+    with _tag_cache_lock:
+        if _tag_cache_epochs.get(repo_path) != epoch:
+            clear_tag_cache(repo_path)
+            _tag_cache_epochs[repo_path] = epoch
+        return _tag_result_cache.get((kind, repo_path, sha, pattern), _MISS)
+
+
+def _tag_cache_put(kind: str, repo_path: str, sha: str, pattern: str, value: object) -> None:
+    if not _FULL_SHA_RE.fullmatch(sha):
+        return  # symbolic revisions move; only commit IDs are safe to memoize
+    with _tag_cache_lock:
+        epoch = _tag_cache_epochs.get(repo_path)
+        if epoch is not None and ref_state_is_settled(epoch):
+            _tag_result_cache[(kind, repo_path, sha, pattern)] = value
+
+
+def find_follows_tag(sha: str, repo_path: StrPath, tag_pattern: str) -> SimpleNamespace | None:
+    """Cached wrapper around _find_follows_tag; see the tag cache notes above."""
+    repo_path = os.fspath(repo_path)
+    cached = _tag_cache_get("follows", repo_path, sha, tag_pattern)
+    if cached is not _MISS:
+        return cached
+    result = _find_follows_tag(sha, repo_path, tag_pattern)
+    _tag_cache_put("follows", repo_path, sha, tag_pattern, result)
+    return result
+
+
+def find_precedes_tag(sha: str, repo_path: StrPath, tag_pattern: str) -> SimpleNamespace | None:
+    """Cached wrapper around _find_precedes_tag; see the tag cache notes above."""
+    repo_path = os.fspath(repo_path)
+    cached = _tag_cache_get("precedes", repo_path, sha, tag_pattern)
+    if cached is not _MISS:
+        return cached
+    result = _find_precedes_tag(sha, repo_path, tag_pattern)
+    _tag_cache_put("precedes", repo_path, sha, tag_pattern, result)
+    return result
+
+
+def _find_follows_tag(sha: str, repo_path: str, tag_pattern: str) -> SimpleNamespace | None:
     """
     Finds the nearest matching tag that precedes the given commit (excluding its own tag).
 
@@ -223,11 +631,14 @@ def find_follows_tag(sha: str, repo_path: str, tag_pattern: str) -> SimpleNamesp
         return None
 
 
-def find_precedes_tag(sha: str, repo_path: str, tag_pattern: str) -> SimpleNamespace | None:
+def _find_precedes_tag(sha: str, repo_path: str, tag_pattern: str) -> SimpleNamespace | None:
     """
     Walks the commit graph forward from the given SHA to find the first descendant
     with a tag matching the given pattern.
 
+    Descendants come from `git rev-list --ancestry-path`, so every candidate is a true
+    descendant of sha and needs no separate ancestry check.
+
     Returns:
         A SimpleNamespace with:
             - base_tag (str): the matching tag name
@@ -245,51 +656,37 @@ def find_precedes_tag(sha: str, repo_path: str, tag_pattern: str) -> SimpleNames
         if not tag_shas:
             return None
 
-        rev_list = get_topo_ordered_commits(repo_path)
-
-        logger.debug("rev-list contains %d commits", len(rev_list))
-        if sha not in rev_list:
-            logger.warning("Commit %s not found in rev-list --topo-order --reverse", sha)
-
-        try:
-            i = rev_list.index(sha)
-        except ValueError:
-            return None
-
-        for descendant_sha in rev_list[i + 1 :]:
-            logger.debug("Checking descendant SHA: %s", descendant_sha)
+        result = run_git(
+            repo_path,
+            "rev-list",
+            "--topo-order",
+            "--reverse",
+            "--ancestry-path",
+            "--all",
+            f"^{sha}",
+            check=True,
+        )
 
+        for descendant_sha in result.stdout.splitlines():
             if descendant_sha in tag_shas:
-                # Verify this is truly a descendant, not an ancestor or unrelated
-                logger.debug(
-                    "Running: git merge-base --is-ancestor %s %s",
-                    descendant_sha,
-                    sha,
-                )
-
-                if is_ancestor(descendant_sha, sha, repo_path):
-                    logger.debug(
-                        "Skipping tag SHA %s — it's actually an ancestor of %s",
-                        descendant_sha,
-                        sha,
-                    )
-                    continue
-
                 tag = tag_shas[descendant_sha]
                 logger.debug("Found descendant tag: %s at SHA: %s", tag, descendant_sha)
-
                 return SimpleNamespace(base_tag=tag, tag_sha=descendant_sha)
 
         logger.debug("No matching Precedes tag found for commit: %s", sha)
 
     except subprocess.SubprocessError as e:
-        # Likely due to tag lookup or invalid rev-list index
+        # Likely due to tag lookup or an unknown commit
         logger.debug("Subprocess error during precedes resolution for %s: %s", sha, e)
 
     return None
 
 
-def get_describe_name(repo_path: str, sha: str, match: str = "rel-*") -> str | None:
+def get_describe_name(repo_path: StrPath, sha: str, match: str = "rel-*") -> str | None:
+    repo_path = os.fspath(repo_path)
+    cached = _tag_cache_get("describe", repo_path, sha, match)
+    if cached is not _MISS:
+        return cached
     try:
         result = run_git(
             repo_path,
@@ -300,50 +697,104 @@ def get_describe_name(repo_path: str, sha: str, match: str = "rel-*") -> str | N
             sha,
             check=True,
         )
-        return result.stdout.strip()
+        name = result.stdout.strip()
+    except subprocess.CalledProcessError:
+        name = None
+    _tag_cache_put("describe", repo_path, sha, match, name)
+    return name
+
+
+async def get_describe_name_async(repo_path: StrPath, sha: str, match: str = "rel-*") -> str | None:
+    """Async variant of get_describe_name for use from request handlers."""
+    repo_path = os.fspath(repo_path)
+    cached = _tag_cache_get("describe", repo_path, sha, match)
+    if cached is not _MISS:
+        return cached
+    try:
+        result = await run_git_async(repo_path, "describe", "--tags", "--match", match, sha, check=True)
+        name = result.stdout.strip()
     except subprocess.CalledProcessError:
+        name = None
+    except subprocess.SubprocessError:
+        # A timed-out describe says nothing about the tags; answer None without caching it.
+        logger.warning("git describe timed out for %s in %s", sha, repo_path)
         return None
+    _tag_cache_put("describe", repo_path, sha, match, name)
+    return name
 
 
-@lru_cache(maxsize=1)
-def _get_all_tag_commits(repo_path: str) -> dict[str, str]:
+_GLOB_START_RE = re.compile(r"[*?\[]")
+
+
+def _tag_ref_patterns(pattern: str) -> Tuple[str, ...]:
+    """
+    Return for-each-ref patterns selecting a superset of the tags fnmatch(pattern) accepts.
+
+    git's ref globs don't let * or ? cross '/', unlike fnmatch, so the patterns only pin the
+    pattern's literal prefix (e.g. 'rel-*' -> refs/tags/rel-* and refs/tags/rel-*/**) and
+    leave the exact match to fnmatch over the much smaller result.
     """
-    Return mapping of tag names -> commit SHAs (peeled).
-    Cached once per repo_path.
+    start = _GLOB_START_RE.search(pattern)
+    prefix = pattern[: start.start()] if start else pattern
+    if not prefix or "\\" in prefix:
+        return ("refs/tags",)
+    return (f"refs/tags/{prefix}*", f"refs/tags/{prefix}*/**")
+
+
+def _get_tag_commits(repo_path: str, pattern: str) -> dict[str, str]:
+    """
+    Return mapping of tag names -> commit SHAs (peeled), covering at least the tags
+    matching pattern.
+
+    Cached per (repo_path, ref patterns, tag ref mtimes), so adding or moving a tag is picked
+    up on the next call. Maps read within the racy window of a tag change are not cached.
+    """
+    ref_patterns = _tag_ref_patterns(pattern)
+    epoch = _tag_refs_epoch(repo_path)
+    if not is_settled(max(epoch)):
+        return _load_tag_commits(repo_path, ref_patterns)
+    return _load_tag_commits_cached(repo_path, ref_patterns, epoch)
+
+
+@lru_cache(maxsize=8)
+def _load_tag_commits_cached(
+    repo_path: str, ref_patterns: Tuple[str, ...], epoch: Tuple[float, float]
+) -> dict[str, str]:
+    return _load_tag_commits(repo_path, ref_patterns)
+
+
+def _load_tag_commits(repo_path: str, ref_patterns: Tuple[str, ...]) -> dict[str, str]:
+    """
+    Read the tags matching ref_patterns with one for-each-ref call.
+
+    %(*objectname) is the peeled target of an annotated tag and empty for a lightweight
+    one, so no rev-parse per tag is needed.
     """
     result = run_git(
         repo_path,
         "for-each-ref",
-        "--format=%(refname:strip=2) %(objectname)",
-        "refs/tags",
+        "--format=%(refname:strip=2) %(objectname) %(*objectname)",
+        *ref_patterns,
         check=True,
     )
     mapping: dict[str, str] = {}
-    for line in result.stdout.strip().splitlines():
-        if not line.strip():
+    for line in result.stdout.splitlines():
+        fields = line.split()
+        if len(fields) < 2:
             continue
-        tag_name, obj = line.split()
-        # peel annotated tags if necessary
-        peel = run_git(
-            repo_path,
-            "rev-parse",
-            f"{tag_name}^{{}}",
-            check=False,
-        )
-        sha = peel.stdout.strip() if peel.returncode == 0 else obj
-        mapping[tag_name] = sha
+        tag_name, obj, *peeled = fields
+        mapping[tag_name] = peeled[0] if peeled else obj
     return mapping
 
 
-def get_matching_tag_commits(repo_path: str, pattern: str) -> dict[str, str]:
+def get_matching_tag_commits(repo_path: StrPath, pattern: str) -> dict[str, str]:
     """
     Return a mapping of tag commit SHAs to tag names for tags matching the pattern.
     """
-    all_tags = _get_all_tag_commits(repo_path)
-    tag_shas: dict[str, str] = {}
-    for tag_name, sha in all_tags.items():
-        if fnmatch.fnmatch(tag_name, pattern):
-            tag_shas[sha] = tag_name
+    repo_path = os.fspath(repo_path)
+    tags = _get_tag_commits(repo_path, pattern)
+    # git only narrowed the list to the pattern's prefix; fnmatch decides the exact match.
+    tag_shas = {tags[tag_name]: tag_name for tag_name in fnmatch.filter(tags, pattern)}
     logger.debug("Filtered %d matching tags for pattern '%s'", len(tag_shas), pattern)
     return tag_shas
 
@@ -366,10 +817,25 @@ def get_topo_ordered_commits(repo_path: str) -> list[str]:
     return commits
 
 
-def is_ancestor(ancestor_sha: str, descendant_sha: str, repo_path: str) -> bool:
+def is_ancestor(ancestor_sha: str, descendant_sha: str, repo_path: StrPath) -> bool:
     """
     Return True if ancestor_sha is an ancestor of descendant_sha.
+
+    Answers for a pair of full commit SHAs never change, so those (positive and
+    negative alike) are memoized; symbolic revisions always ask git.
     """
+    repo_path = os.fspath(repo_path)
+    if _FULL_SHA_RE.fullmatch(ancestor_sha) and _FULL_SHA_RE.fullmatch(descendant_sha):
+        return _is_ancestor_cached(ancestor_sha, descendant_sha, repo_path)
+    return _run_is_ancestor(ancestor_sha, descendant_sha, repo_path)
+
+
+@lru_cache(maxsize=4096)
+def _is_ancestor_cached(ancestor_sha: str, descendant_sha: str, repo_path: str) -> bool:
+    return _run_is_ancestor(ancestor_sha, descendant_sha, repo_path)
+
+
+def _run_is_ancestor(ancestor_sha: str, descendant_sha: str, repo_path: str) -> bool:
     return (
         run_git(
             repo_path,
@@ -383,6 +849,9 @@ def is_ancestor(ancestor_sha: str, descendant_sha: str, repo_path: str) -> bool:
     )
 
 
+_DESCRIBE_RE = re.compile(r"(.+)-(\d+)-g[0-9a-f]{7,}")
+
+
 def parse_describe_output(raw: str) -> tuple[str, int] | None:
     """
     Parse the output of `git describe` into a (tag, count) tuple.
@@ -394,8 +863,7 @@ def parse_describe_output(raw: str) -> tuple[str, int] | None:
         A tuple of (base_tag, count) if the input includes a commit count,
         or None if the input appears to be a direct tag (e.g., "rel-1.2.3").
     """
-    m = re.match(r"(.+)-(\d+)-g([0-9a-f]{7,})", raw)
+    m = _DESCRIBE_RE.match(raw)
     if m:
-        base_tag, count, _ = m.groups()
-        return base_tag, int(count)
+        return m.group(1), int(m.group(2))
     return None
@@ -2,11 +2,14 @@
 
 from __future__ import annotations
 
+import os
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import Iterable, Optional
 
 from .commit_parsing import extract_issue_slugs
+from .issues import ISSUE_SUBDIRS, issue_slugs
 
 
 @dataclass
@@ -45,28 +48,42 @@ def compute_issue_suggestion(
 
     Returns:
         IssueSuggestionResult capturing candidate slugs, suggestion choice, and provenance.
+        Results are memoized and may be shared between calls, so treat them as read-only.
     """
 
-    repo_root = Path(repo_path)
-    touched_paths_list = list(touched_paths or [])
+    # The current issue-slug set is part of the key, so adding or removing an issue file
+    # naturally misses the cache; existing_issue_slugs returns the same frozenset object
+    # (whose hash Python caches) while the issue directories are unchanged.
+    return _suggest_issue(
+        message_text or "",
+        tuple(touched_paths or ()),
+        existing_issue_slugs(os.fspath(repo_path)),
+    )
+
 
-    primary, slugs = extract_issue_slugs(message_text or "")
+@lru_cache(maxsize=8192)
+def _suggest_issue(
+    message_text: str, touched_paths: tuple[str, ...], known_slugs: frozenset[str]
+) -> IssueSuggestionResult:
+    primary, slugs = extract_issue_slugs(message_text)
     message_matches: list[str] = []
 
     for slug in slugs:
-        if _issue_exists(repo_root, slug):
+        if slug in known_slugs:
             message_matches.append(slug)
 
     touched_issue_slugs: list[str] = []
-    for path in touched_paths_list:
-        if path.startswith("issues/open/") or path.startswith("issues/closed/"):
-            if path.endswith(".md"):
-                slug = Path(path).stem
-                if slug not in touched_issue_slugs:
-                    touched_issue_slugs.append(slug)
+    touched_seen: set[str] = set()
+    for path in touched_paths:
+        if path.startswith(_TOUCHED_ISSUE_PREFIXES) and path.endswith(".md"):
+            slug = path[path.rfind("/") + 1 : -3]
+            if slug and slug not in touched_seen:
+                touched_seen.add(slug)
+                touched_issue_slugs.append(slug)
 
     existing_issues = _dedupe_preserving_order(message_matches + touched_issue_slugs)
-    touched_candidates = [slug for slug in touched_issue_slugs if slug not in message_matches]
+    message_set = set(message_matches)
+    touched_candidates = [slug for slug in touched_issue_slugs if slug not in message_set]
 
     suggestion: Optional[str] = None
     suggestion_source: Optional[str] = None
@@ -91,12 +108,17 @@ def compute_issue_suggestion(
     )
 
 
-def _issue_exists(repo_root: Path, slug: str) -> bool:
-    for subdir in ("open", "closed"):
-        issue_path = repo_root / "issues" / subdir / f"{slug}.md"
-        if issue_path.exists():
-            return True
-    return False
+_TOUCHED_ISSUE_PREFIXES = tuple(f"issues/{subdir}/" for subdir in ISSUE_SUBDIRS)
+
+
+def existing_issue_slugs(repo_root: str) -> frozenset[str]:
+    """
+    Return the slugs of every issue file under issues/open and issues/closed.
+
+    Backed by the cached directory snapshot in utils.issues, so repeat calls cost two
+    stat() calls while neither directory's mtime has moved.
+    """
+    return issue_slugs(os.path.join(repo_root, "issues"))
 
 
 def _dedupe_preserving_order(items: list[str]) -> list[str]:
@@ -1,27 +1,87 @@
+import os
+import time
+from pathlib import Path
 from types import SimpleNamespace
-from typing import Sequence
+from typing import Iterable, Mapping, Sequence
 
 from .commit_parsing import extract_issue_slugs
+from .mtime import is_settled, mtime_or_missing
 
+# Listed in lookup priority: a slug present in both directories resolves to open/.
+ISSUE_SUBDIRS = ("open", "closed")
+_issue_file_cache: dict[str, tuple[tuple[float, ...], float, dict[str, Path], frozenset[str]]] = {}
 
-def find_commits_referring_to_issue(slug: str, commits: Sequence[SimpleNamespace]) -> list[SimpleNamespace]:
-    referring = []
 
-    for row in commits:
-        # Check 1: explicitly annotated issue (if available)
-        if getattr(row, "issue", None) == slug:
-            referring.append(row)
+def _issue_file_snapshot(issues_dir: str | os.PathLike) -> tuple[dict[str, Path], frozenset[str]]:
+    """
+    Scan issues_dir/open and issues_dir/closed once, as {slug: path} plus the slug set.
+
+    Cached per directory and reused while neither subdirectory's mtime has moved.
+    """
+    root = os.fspath(issues_dir)
+    dirs = [os.path.join(root, subdir) for subdir in ISSUE_SUBDIRS]
+    stamps = tuple(mtime_or_missing(d) for d in dirs)
+
+    cached = _issue_file_cache.get(root)
+    if cached is not None:
+        cached_stamps, scanned_at, paths, slugs = cached
+        # A scan taken within the racy window of a directory change is not reused.
+        if cached_stamps == stamps and is_settled(max(stamps), now=scanned_at):
+            return paths, slugs
+
+    scanned_at = time.time()
+    paths: dict[str, Path] = {}
+    # Lowest priority first, so open/ overwrites closed/ for a slug present in both.
+    for d, stamp in reversed(list(zip(dirs, stamps, strict=True))):
+        if stamp < 0:
             continue
+        for entry in os.scandir(d):
+            if entry.name.endswith(".md") and entry.is_file():
+                paths[entry.name[:-3]] = Path(entry.path)
+    slugs = frozenset(paths)
+    _issue_file_cache[root] = (stamps, scanned_at, paths, slugs)
+    return paths, slugs
+
+
+def issue_files(issues_dir: str | os.PathLike) -> Mapping[str, Path]:
+    """Return {slug: path of its issue file} for every issue under issues_dir. Read-only."""
+    return _issue_file_snapshot(issues_dir)[0]
+
+
+def issue_slugs(issues_dir: str | os.PathLike) -> frozenset[str]:
+    """Return the slugs of every issue under issues_dir (the same object while unchanged)."""
+    return _issue_file_snapshot(issues_dir)[1]
 
-        # Check 2: directive or mention in message
-        _, linked = extract_issue_slugs(row.message)
+
+def _refers_to_issue(slug: str, issue, message: str, paths) -> bool:
+    # Check 1: explicitly annotated issue (if available)
+    if issue == slug:
+        return True
+
+    # Check 2: directive or mention in message. Every extracted slug is a substring of
+    # the message, so messages that do not contain slug can skip the regex scan.
+    if slug in message:
+        _, linked = extract_issue_slugs(message)
         if slug in linked:
-            referring.append(row)
-            continue
+            return True
+
+    # Check 3: touched paths
+    paths = paths or []
+    return f"issues/open/{slug}.md" in paths or f"issues/closed/{slug}.md" in paths
+
+
+def find_commits_referring_to_issue(slug: str, commits: Sequence[SimpleNamespace]) -> list[SimpleNamespace]:
+    return [
+        row
+        for row in commits
+        if _refers_to_issue(slug, getattr(row, "issue", None), row.message, getattr(row, "touched_paths", []))
+    ]
 
-        # Check 3: touched paths
-        paths = getattr(row, "touched_paths", []) or []
-        if f"issues/open/{slug}.md" in paths or f"issues/closed/{slug}.md" in paths:
-            referring.append(row)
 
-    return referring
+def find_rows_referring_to_issue(slug: str, rows: Iterable[Mapping]) -> list[Mapping]:
+    """Same checks as find_commits_referring_to_issue, for plain row dicts such as git log rows."""
+    return [
+        row
+        for row in rows
+        if _refers_to_issue(slug, row.get("issue"), row["message"], row.get("touched_paths", []))
+    ]
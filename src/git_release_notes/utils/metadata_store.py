@@ -1,20 +1,100 @@
 # utils/metadata_store.py
 
 import logging
+import os
 from abc import ABC, abstractmethod
 from pathlib import Path
 
 import pandas as pd
+from tornado.ioloop import IOLoop
 
-from .data import atomic_save_excel, get_row_index_by_sha
+from .data import atomic_save_excel
+from .mtime import is_settled
 
 logger = logging.getLogger(__name__)
 logger.addHandler(logging.NullHandler())
 
 
+def _index_rows_by_sha(df: pd.DataFrame) -> dict[str, dict]:
+    """Map each SHA to its first row as a plain dict (mirrors the old mask + iloc[0] lookup)."""
+    index: dict[str, dict] = {}
+    if "sha" not in df.columns:
+        return index
+    for row in df.to_dict(orient="records"):
+        index.setdefault(row["sha"], row)
+    return index
+
+
+def _normalize_text_columns(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Make the editable columns plain strings in place: NaN (an empty cell) becomes "" and
+    anything else goes through str(). Done once per load so readers can use values as-is.
+    """
+    for column in ("issue", "release"):
+        if column in df.columns:
+            df[column] = df[column].fillna("").astype(str)
+    return df
+
+
+class _RowPositions:
+    """
+    Positional index over a metadata frame: the row positions of each SHA plus cached
+    column positions, so edits can use ``df.iat`` instead of resolving labels.
+
+    Assumes the frame has a RangeIndex, which ``read_csv``, ``read_excel`` and
+    ``pd.concat(..., ignore_index=True)`` all produce.
+    """
+
+    def __init__(self, df: pd.DataFrame):
+        self.by_sha: dict[str, list[int]] = {}
+        if "sha" in df.columns:
+            for position, sha in enumerate(df["sha"].tolist()):
+                self.by_sha.setdefault(sha, []).append(position)
+        self._columns: dict[str, int] = {}
+
+    def column(self, df: pd.DataFrame, name: str) -> int:
+        """Return the position of column ``name``, adding it as an empty column if missing."""
+        position = self._columns.get(name)
+        if position is None:
+            if name not in df.columns:
+                df[name] = ""
+            position = self._columns[name] = df.columns.get_loc(name)
+        return position
+
+
+# A backing file whose (mtime, size) matches the last load is not re-parsed on reload(),
+# unless it was modified within the racy window (see utils.mtime).
+
+
+def _file_signature(path: Path) -> tuple[int, int] | None:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+def _is_unchanged(signature: tuple[int, int] | None, loaded: tuple[int, int] | None) -> bool:
+    return (
+        signature is not None
+        and signature == loaded
+        and is_settled(signature[0] / 1e9)
+    )
+
+
 class CommitMetadataStore(ABC):
     """Abstract base class for reading and writing commit metadata (e.g. issue, release)."""
 
+    #: Bumped whenever the store's rows change (edits or a reload that re-read the file),
+    #: so views derived from the rows can tell when to rebuild.
+    version: int = 0
+
+    #: Handle of the save scheduled by save_soon(), or None when nothing is pending.
+    _save_handle: object | None = None
+
+    #: The exception raised by the most recent save, or None once a save succeeds.
+    last_save_error: Exception | None = None
+
     @abstractmethod
     def get_metadata_df(self) -> pd.DataFrame:
         """
@@ -53,47 +133,122 @@ class CommitMetadataStore(ABC):
         """Optional no-op for stores that persist immediately."""
         return None
 
+    def save_soon(self, delay: float = 0.0) -> None:
+        """
+        Save after ``delay`` seconds without further calls (trailing-edge debounce).
+
+        A burst of edits costs one write; edits still inside the window are lost if the
+        process dies before it elapses. With ``delay <= 0`` the save runs immediately and
+        its exception propagates to the caller. A deferred save that fails is recorded in
+        ``last_save_error``. Must be called on the IOLoop thread.
+        """
+        loop = IOLoop.current()
+        if self._save_handle is not None:
+            loop.remove_timeout(self._save_handle)
+            self._save_handle = None
+        if delay <= 0:
+            self._save_now()
+        else:
+            self._save_handle = loop.call_later(delay, self._flush_save)
+
+    def flush_pending_save(self) -> None:
+        """Run a save scheduled by save_soon() now, e.g. before shutting down."""
+        if self._save_handle is not None:
+            IOLoop.current().remove_timeout(self._save_handle)
+            self._flush_save()
+
+    def _save_now(self) -> None:
+        try:
+            self.save()
+        except Exception as exc:
+            self.last_save_error = exc
+            raise
+        self.last_save_error = None
+
+    def _flush_save(self) -> None:
+        self._save_handle = None
+        try:
+            self._save_now()
+        except Exception:
+            logger.exception("%s save failed", type(self).__name__)
+
+    def _save_pending(self) -> bool:
+        """
+        True while in-memory edits have not reached disk, either waiting on save_soon() or
+        after a failed save; reload() must not clobber them.
+        """
+        return self._save_handle is not None or self.last_save_error is not None
+
 
 class SpreadsheetCommitMetadataStore(CommitMetadataStore):
     """Backs commit metadata with a spreadsheet DataFrame and Excel path."""
 
     def __init__(self, df: pd.DataFrame, excel_path: Path):
-        self._df = df
+        self._df = _normalize_text_columns(df)
         self.excel_path = Path(excel_path)
-
-    def _ensure_row(self, sha: str):
-        """Ensure that a row exists for the given SHA; insert one if missing."""
-        if sha not in self._df["sha"].values:
+        self._by_sha: dict[str, dict] | None = None
+        self._positions: _RowPositions | None = None
+        self._loaded_signature: tuple[int, int] | None = None
+
+    def _ensure_row(self, sha: str) -> list[int]:
+        """Ensure that a row exists for the given SHA, inserting one if missing; return its row positions."""
+        if self._positions is None:
+            self._positions = _RowPositions(self._df)
+        rows = self._positions.by_sha.get(sha)
+        if rows is None:
             self._df = pd.concat(
                 [self._df, pd.DataFrame([{"sha": sha, "issue": "", "release": ""}])], ignore_index=True
             )
+            # concat may have added or reordered columns; rebuild the index over the new frame.
+            self._positions = _RowPositions(self._df)
+            rows = self._positions.by_sha[sha]
+            self._by_sha = None
+            self.version += 1
+        return rows
+
+    def _set_value(self, sha: str, column: str, value: str) -> None:
+        rows = self._ensure_row(sha)
+        col = self._positions.column(self._df, column)
+        for row in rows:
+            self._df.iat[row, col] = value
 
     def get_metadata_df(self) -> pd.DataFrame:
         return self._df.fillna("")
 
     def get_row(self, sha: str) -> dict | None:
-        match = self._df[self._df["sha"] == sha]
-        if not match.empty:
-            return match.iloc[0].to_dict()
-        return None
+        if self._by_sha is None:
+            self._by_sha = _index_rows_by_sha(self._df)
+        row = self._by_sha.get(sha)
+        return dict(row) if row is not None else None
 
     def limits_commit_set(self) -> bool:
         return True
 
     def reload(self) -> None:
+        if self._save_pending():
+            return
+        signature = _file_signature(self.excel_path)
+        if _is_unchanged(signature, self._loaded_signature):
+            return
         try:
             # Assumes the sheet written by `atomic_save_excel` has the expected columns
-            self._df = pd.read_excel(self.excel_path)
+            self._df = _normalize_text_columns(pd.read_excel(self.excel_path))
+            self._by_sha = None
+            self._positions = None
+            self.version += 1
+            self._loaded_signature = signature
         except Exception as e:
             logger.warning("SpreadsheetCommitMetadataStore reload failed: %s", e)
 
     def set_issue(self, sha: str, value: str):
-        self._ensure_row(sha)
-        self._df.loc[self._df["sha"] == sha, "issue"] = value
+        self._set_value(sha, "issue", value)
+        self._by_sha = None
+        self.version += 1
 
     def set_release(self, sha: str, value: str):
-        self._ensure_row(sha)
-        self._df.loc[self._df["sha"] == sha, "release"] = value
+        self._set_value(sha, "release", value)
+        self._by_sha = None
+        self.version += 1
 
     def save(self) -> None:
         atomic_save_excel(self._df, self.excel_path)
@@ -111,8 +266,11 @@ class DataFrameCommitMetadataStore(CommitMetadataStore):
 
     def __init__(self, csv_path: Path = Path("git-view.metadata.csv")):
         self.path = Path(csv_path)
+        self._by_sha: dict[str, dict] | None = None
+        self._positions: _RowPositions | None = None
+        self._loaded_signature = _file_signature(self.path)
         if self.path.exists():
-            self.df = pd.read_csv(self.path)
+            self.df = _normalize_text_columns(pd.read_csv(self.path))
         else:
             self.df = pd.DataFrame(columns=["sha", "issue", "release"])
 
@@ -120,34 +278,51 @@ class DataFrameCommitMetadataStore(CommitMetadataStore):
         return self.df.fillna("")
 
     def get_row(self, sha: str) -> dict | None:
-        match = self.df[self.df["sha"] == sha]
-        if not match.empty:
-            return match.iloc[0].to_dict()
-        return None
+        if self._by_sha is None:
+            self._by_sha = _index_rows_by_sha(self.df)
+        row = self._by_sha.get(sha)
+        return dict(row) if row is not None else None
 
     def limits_commit_set(self) -> bool:
         return False
 
     def reload(self) -> None:
+        if self._save_pending():
+            return
+        signature = _file_signature(self.path)
+        if _is_unchanged(signature, self._loaded_signature):
+            return
         if self.path.exists():
             try:
-                self.df = pd.read_csv(self.path)
+                self.df = _normalize_text_columns(pd.read_csv(self.path))
+                self._by_sha = None
+                self._positions = None
+                self.version += 1
+                self._loaded_signature = signature
             except Exception as e:
                 logger.warning("DataFrameCommitMetadataStore reload failed: %s", e)
 
-    def set_issue(self, sha: str, issue: str) -> None:
-        row_idx = get_row_index_by_sha(self.df, sha)
-        if row_idx is None:
-            self.df.loc[len(self.df)] = [sha, issue, ""]
+    def _set_value(self, sha: str, column: str, value: str) -> None:
+        """Set ``column`` on the first row for sha, appending a row if there is none."""
+        if self._positions is None:
+            self._positions = _RowPositions(self.df)
+        # Add the column first: appending a row drops keys the frame has no column for.
+        col = self._positions.column(self.df, column)
+        rows = self._positions.by_sha.get(sha)
+        if rows is None:
+            position = len(self.df)
+            self.df.loc[position] = {"sha": sha, "issue": "", "release": "", column: value}
+            self._positions.by_sha[sha] = [position]
         else:
-            self.df.at[row_idx, "issue"] = issue
+            self.df.iat[rows[0], col] = value
+        self._by_sha = None
+        self.version += 1
+
+    def set_issue(self, sha: str, issue: str) -> None:
+        self._set_value(sha, "issue", issue)
 
     def set_release(self, sha: str, release: str) -> None:
-        row_idx = get_row_index_by_sha(self.df, sha)
-        if row_idx is None:
-            self.df.loc[len(self.df)] = [sha, "", release]
-        else:
-            self.df.at[row_idx, "release"] = release
+        self._set_value(sha, "release", release)
 
     def save(self) -> None:
         self.df.to_csv(self.path, index=False)
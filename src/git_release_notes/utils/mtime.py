@@ -0,0 +1,25 @@
+"""
+Modification-time helpers shared by the caches keyed on filesystem timestamps.
+
+Coarse filesystem timestamps can hide a second write that lands in the same tick as
+the first, so an unchanged mtime only proves nothing changed once it is older than
+RACY_WINDOW_S. Results read before then are recomputed rather than reused.
+"""
+
+import os
+import time
+
+RACY_WINDOW_S = 1.0
+
+
+def mtime_or_missing(path: str | os.PathLike) -> float:
+    """Return the mtime of path in seconds, or -1.0 if it cannot be stat'ed."""
+    try:
+        return os.stat(path).st_mtime
+    except OSError:
+        return -1.0
+
+
+def is_settled(mtime: float, now: float | None = None) -> bool:
+    """True when mtime is more than RACY_WINDOW_S before now (default: the current time)."""
+    return (time.time() if now is None else now) - mtime > RACY_WINDOW_S
@@ -5,7 +5,9 @@ Provides shared functions and fixtures for initializing Git state
 across unit and integration tests.
 """
 
+import os
 import subprocess
+import time
 from pathlib import Path
 
 import pytest
@@ -16,6 +18,23 @@ def create_tag(repo: Path, sha: str, tagname: str):
     subprocess.run(["git", "tag", tagname, sha], cwd=repo, check=True)
 
 
+def age_refs(repo: Path, refs_dir: str = "refs", seconds: float = 10.0) -> None:
+    """
+    Backdate every directory under repo's ``refs_dir`` by ``seconds``.
+
+    Ref-keyed caches skip results read within the racy window of a ref change, so tests
+    age the refs to get the first answer cached.
+    """
+    past = time.time() - seconds
+    for dirpath, _, _ in os.walk(repo / ".git" / refs_dir):
+        os.utime(dirpath, (past, past))
+
+
+def age_tag_refs(repo: Path, seconds: float = 10.0) -> None:
+    """Backdate the tag ref directories of repo; see age_refs."""
+    age_refs(repo, "refs/tags", seconds)
+
+
 def get_log_shas(repo: Path) -> list[str]:
     """Return all commit SHAs in rev-list --reverse order."""
     result = subprocess.run(
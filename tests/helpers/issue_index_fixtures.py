@@ -9,6 +9,7 @@ or to reason about ordering expectations without repeating literal strings.
 
 from __future__ import annotations
 
+import csv
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
@@ -75,9 +76,12 @@ def ensure_issue_files(repo_root: Path, issues: Iterable[IssueRecord] = ISSUE_IN
     already exist so tests can call this repeatedly to reset state.
     """
     paths: list[Path] = []
+    created_dirs: set[Path] = set()
     for record in issues:
         base_dir = repo_root / "issues" / record.status
-        base_dir.mkdir(parents=True, exist_ok=True)
+        if base_dir not in created_dirs:
+            base_dir.mkdir(parents=True, exist_ok=True)
+            created_dirs.add(base_dir)
         path = base_dir / f"{record.slug}.md"
         contents = [
             f"# {record.slug.replace('-', ' ').title()}",
@@ -111,12 +115,13 @@ def write_metadata_csv(
         release_lookup.update(releases)
 
     metadata_path = repo_root / "git-view.metadata.csv"
-    lines = ["sha,issue,release"]
-    for sha, issue_slug in commit_issue_map.items():
-        release = release_lookup.get(issue_slug, "")
-        lines.append(f"{sha},{issue_slug},{release}")
-
-    metadata_path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    with metadata_path.open("w", newline="", encoding="utf-8") as handle:
+        writer = csv.writer(handle, lineterminator="\n")
+        writer.writerow(("sha", "issue", "release"))
+        writer.writerows(
+            (sha, issue_slug, release_lookup.get(issue_slug, ""))
+            for sha, issue_slug in commit_issue_map.items()
+        )
     return metadata_path
 
 
@@ -136,12 +141,15 @@ def write_commits_csv(
                     should be written. If omitted, synthetic fixture IDs are used.
     """
     commit_path = repo_root / "commits.csv"
-    lines = ["sha,summary,issue,landed_at"]
+    rows = []
     for idx, (issue_slug, landed_at) in enumerate(landing_map.items(), start=1):
         sha = commit_ids[issue_slug] if commit_ids and issue_slug in commit_ids else f"fixture-{idx:02d}"
         summary = issue_slug.replace("-", " ").title()
         landed_iso = landed_at.astimezone(timezone.utc).isoformat()
-        lines.append(f"{sha},{summary},{issue_slug},{landed_iso}")
+        rows.append((sha, summary, issue_slug, landed_iso))
 
-    commit_path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    with commit_path.open("w", newline="", encoding="utf-8") as handle:
+        writer = csv.writer(handle, lineterminator="\n")
+        writer.writerow(("sha", "summary", "issue", "landed_at"))
+        writer.writerows(rows)
     return commit_path
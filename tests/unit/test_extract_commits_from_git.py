@@ -25,3 +25,22 @@ def test_extract_commits_with_touched_paths(tmp_path):
     assert "message" in commit
     assert "touched_paths" in commit
     assert "test.txt" in commit["touched_paths"]
+
+
+def test_extract_commits_reuses_scan_until_head_moves(tmp_path):
+    repo = tmp_path / "repo"
+    repo.mkdir()
+    subprocess.run(["git", "init", "-q"], cwd=repo, check=True)
+    subprocess.run(["git", "config", "user.name", "Test"], cwd=repo, check=True)
+    subprocess.run(["git", "config", "user.email", "test@example.com"], cwd=repo, check=True)
+    subprocess.run(["git", "commit", "-q", "--allow-empty", "-m", "first"], cwd=repo, check=True)
+
+    first = extract_commits_from_git(str(repo))
+    first[0]["release"] = "mutated"
+    first[0]["touched_paths"].append("mutated.txt")
+    again = extract_commits_from_git(str(repo))
+    assert again[0]["release"] == ""
+    assert again[0]["touched_paths"] == []
+
+    subprocess.run(["git", "commit", "-q", "--allow-empty", "-m", "second"], cwd=repo, check=True)
+    assert [c["message"] for c in extract_commits_from_git(str(repo))] == ["second", "first"]
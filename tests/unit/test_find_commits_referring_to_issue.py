@@ -1,6 +1,6 @@
 from types import SimpleNamespace
 
-from git_release_notes.utils.issues import find_commits_referring_to_issue
+from git_release_notes.utils.issues import find_commits_referring_to_issue, find_rows_referring_to_issue
 
 
 def make_row(**kwargs):
@@ -41,3 +41,13 @@ def test_no_match():
     commits = [make_row(message="unrelated commit")]
     result = find_commits_referring_to_issue("my-feature", commits)
     assert len(result) == 0
+
+
+def test_rows_variant_matches_plain_dicts():
+    rows = [
+        {"sha": "a", "message": "Implements my-feature", "touched_paths": []},
+        {"sha": "b", "message": "unrelated commit", "touched_paths": ["issues/open/my-feature.md"]},
+        {"sha": "c", "message": "unrelated commit", "touched_paths": []},
+    ]
+    result = find_rows_referring_to_issue("my-feature", rows)
+    assert [row["sha"] for row in result] == ["a", "b"]
@@ -1,8 +1,11 @@
+import asyncio
 import subprocess
 from pathlib import Path
 
-from git_release_notes.utils.git import get_commit_parents_and_children
-from tests.helpers.git_fixtures import create_tag
+import pytest
+
+from git_release_notes.utils.git import get_commit_parents_and_children, run_git, run_git_async
+from tests.helpers.git_fixtures import age_refs, age_tag_refs, create_tag
 
 
 def test_get_describe_name_returns_expected_string(test_repo: Path):
@@ -48,3 +51,210 @@ def test_commit_graph_extraction(test_repo: Path):
     parents0, children0 = get_commit_parents_and_children(sha0, str(test_repo))
     assert parents0 == []
     assert sha1 in children0
+
+
+def test_commit_graph_sees_commits_made_after_the_first_scan(test_repo: Path):
+    shas = get_log_shas(test_repo)
+    get_commit_parents_and_children(shas[-1], str(test_repo))
+
+    (test_repo / "file.txt").write_text("d\n")
+    subprocess.run(["git", "commit", "-am", "fourth"], cwd=test_repo, check=True)
+    new_sha = get_log_shas(test_repo)[-1]
+
+    parents, children = get_commit_parents_and_children(new_sha, str(test_repo))
+    assert parents == [shas[-1]]
+    assert children == []
+
+    # The new commit is also a child of the old tip once HEAD has moved.
+    assert get_commit_parents_and_children(shas[-1], str(test_repo))[1] == [new_sha]
+
+
+def test_commit_graph_sees_commits_on_other_branches(test_repo: Path):
+    shas = get_log_shas(test_repo)
+    age_refs(test_repo)
+    assert get_commit_parents_and_children(shas[0], str(test_repo))[1] == [shas[1]]
+
+    # Commit onto a side branch without moving HEAD.
+    side_sha = run_git(
+        str(test_repo), "commit-tree", f"{shas[0]}^{{tree}}", "-p", shas[0], "-m", "side", check=True
+    ).stdout.strip()
+    run_git(str(test_repo), "update-ref", "refs/heads/side", side_sha, check=True)
+
+    assert sorted(get_commit_parents_and_children(shas[0], str(test_repo))[1]) == sorted([shas[1], side_sha])
+
+
+def test_run_git_async_mirrors_run_git(test_repo: Path):
+    async def scenario():
+        ok = await run_git_async(str(test_repo), "rev-parse", "HEAD")
+        with pytest.raises(subprocess.CalledProcessError):
+            await run_git_async(str(test_repo), "rev-parse", "--verify", "no-such-ref", check=True)
+        with pytest.raises(subprocess.TimeoutExpired):
+            await run_git_async(str(test_repo), "-c", "alias.nap=!sleep 5", "nap", timeout=0.2)
+        return ok
+
+    # One event loop for both calls: tornado binds its SIGCHLD handler to the first loop it sees.
+    result = asyncio.run(scenario())
+    assert result.returncode == 0
+    assert result.stdout == run_git(str(test_repo), "rev-parse", "HEAD").stdout
+
+
+def test_describe_async_timeout_returns_none_uncached(test_repo: Path, monkeypatch):
+    from git_release_notes.utils import git as git_utils
+
+    shas = get_log_shas(test_repo)
+
+    async def timed_out(*args, **kwargs):
+        raise subprocess.TimeoutExpired(["git", "describe"], 30.0)
+
+    monkeypatch.setattr(git_utils, "run_git_async", timed_out)
+    assert asyncio.run(git_utils.get_describe_name_async(str(test_repo), shas[2])) is None
+    assert git_utils._tag_cache_get("describe", str(test_repo), shas[2], "rel-*") is git_utils._MISS
+
+
+def test_git_batch_session_resolves_revisions(test_repo: Path):
+    from git_release_notes.utils.git import GitBatchSession
+
+    shas = get_log_shas(test_repo)
+    create_tag(test_repo, shas[0], "rel-0.1")
+    subprocess.run(["git", "tag", "-a", "rel-0.2", shas[1], "-m", "annotated"], cwd=test_repo, check=True)
+
+    session = GitBatchSession(str(test_repo))
+    try:
+        assert session.resolve_commit("HEAD") == shas[-1]
+        assert session.resolve_commit(shas[1][:10]) == shas[1]
+        assert session.resolve_commit("rel-0.1") == shas[0]
+        assert session.resolve_commit("rel-0.2") == shas[1]
+        assert session.resolve_commit("no-such-ref") is None
+        assert session.resolve_commit("HEAD\nHEAD") is None
+    finally:
+        session.close()
+
+
+def test_describe_cache_is_invalidated_by_new_tags(test_repo: Path):
+    from git_release_notes.utils.git import get_describe_name
+
+    shas = get_log_shas(test_repo)
+    create_tag(test_repo, shas[0], "rel-0.1")
+    age_tag_refs(test_repo)
+
+    assert get_describe_name(str(test_repo), shas[2]).startswith("rel-0.1-2-g")
+    assert get_describe_name(str(test_repo), shas[2]).startswith("rel-0.1-2-g")
+
+    create_tag(test_repo, shas[1], "rel-0.2")
+    assert get_describe_name(str(test_repo), shas[2]).startswith("rel-0.2-1-g")
+
+
+def test_describe_cache_is_invalidated_by_new_tags_in_a_linked_worktree(test_repo: Path, tmp_path_factory):
+    from git_release_notes.utils.git import get_describe_name
+
+    shas = get_log_shas(test_repo)
+    create_tag(test_repo, shas[0], "rel-0.1")
+    worktree = tmp_path_factory.mktemp("worktrees") / "wt"
+    subprocess.run(["git", "worktree", "add", "-q", str(worktree), shas[2]], cwd=test_repo, check=True)
+    age_tag_refs(test_repo)
+
+    assert get_describe_name(str(worktree), shas[2]).startswith("rel-0.1-2-g")
+
+    create_tag(worktree, shas[1], "rel-0.2")
+    assert get_describe_name(str(worktree), shas[2]).startswith("rel-0.2-1-g")
+
+
+def test_follows_cache_sees_commits_made_after_the_first_lookup(test_repo: Path):
+    from git_release_notes.utils.git import find_follows_tag
+
+    shas = get_log_shas(test_repo)
+    create_tag(test_repo, shas[0], "rel-0.1")
+    age_tag_refs(test_repo)
+
+    assert find_follows_tag(shas[2], str(test_repo), "rel-*").count == 2
+
+    (test_repo / "file.txt").write_text("d\n")
+    subprocess.run(["git", "commit", "-qam", "fourth"], cwd=test_repo, check=True)
+    new_sha = get_log_shas(test_repo)[-1]
+
+    assert find_follows_tag(new_sha, str(test_repo), "rel-*").count == 3
+
+
+def test_is_ancestor_memoizes_full_sha_pairs(test_repo: Path):
+    from git_release_notes.utils.git import get_git_stats, is_ancestor, reset_git_stats
+
+    shas = get_log_shas(test_repo)
+    reset_git_stats()
+
+    assert is_ancestor(shas[0], shas[2], str(test_repo)) is True
+    assert is_ancestor(shas[0], shas[2], str(test_repo)) is True
+    assert is_ancestor(shas[2], shas[0], str(test_repo)) is False
+    assert is_ancestor(shas[2], shas[0], str(test_repo)) is False
+
+    calls = sum(stats["count"] for args, stats in get_git_stats() if args[0] == "merge-base")
+    assert calls == 2
+
+
+def test_matching_tag_commits_pick_up_new_tags(test_repo: Path):
+    from git_release_notes.utils.git import get_matching_tag_commits
+
+    shas = get_log_shas(test_repo)
+    create_tag(test_repo, shas[0], "rel-0.1")
+    age_tag_refs(test_repo)
+
+    assert get_matching_tag_commits(str(test_repo), "rel-*") == {shas[0]: "rel-0.1"}
+
+    create_tag(test_repo, shas[1], "rel-0.2")
+    assert get_matching_tag_commits(str(test_repo), "rel-*") == {shas[0]: "rel-0.1", shas[1]: "rel-0.2"}
+
+
+def test_tag_caches_pick_up_new_nested_tags(test_repo: Path):
+    from git_release_notes.utils.git import find_follows_tag, get_describe_name, get_matching_tag_commits
+
+    shas = get_log_shas(test_repo)
+    create_tag(test_repo, shas[0], "rel-team/1")
+    age_tag_refs(test_repo)
+
+    assert get_describe_name(str(test_repo), shas[2]).startswith("rel-team/1-2-g")
+    assert find_follows_tag(shas[2], str(test_repo), "rel-*").base_tag == "rel-team/1"
+    assert get_matching_tag_commits(str(test_repo), "rel-*") == {shas[0]: "rel-team/1"}
+
+    # Written into refs/tags/rel-team/, leaving the mtime of refs/tags itself unchanged.
+    create_tag(test_repo, shas[1], "rel-team/2")
+    assert get_describe_name(str(test_repo), shas[2]).startswith("rel-team/2-1-g")
+    assert find_follows_tag(shas[2], str(test_repo), "rel-*").base_tag == "rel-team/2"
+    assert get_matching_tag_commits(str(test_repo), "rel-*") == {shas[0]: "rel-team/1", shas[1]: "rel-team/2"}
+
+
+def test_path_and_str_repo_paths_share_sessions_and_tag_caches(test_repo: Path):
+    from git_release_notes.utils import git as git_utils
+
+    shas = get_log_shas(test_repo)
+    create_tag(test_repo, shas[0], "rel-0.1")
+    age_tag_refs(test_repo)
+
+    assert git_utils.get_git_session(test_repo) is git_utils.get_git_session(str(test_repo))
+    follows = git_utils.find_follows_tag(shas[2], test_repo, "rel-*")
+    assert git_utils._tag_cache_get("follows", str(test_repo), shas[2], "rel-*") is follows
+
+
+def test_batch_touched_paths_matches_git_show(test_repo: Path):
+    from git_release_notes.utils.git import batch_touched_paths
+
+    (test_repo / "other.txt").write_text("x\n")
+    subprocess.run(["git", "add", "other.txt"], cwd=test_repo, check=True)
+    subprocess.run(["git", "commit", "-q", "--allow-empty", "-m", "fourth"], cwd=test_repo, check=True)
+    shas = get_log_shas(test_repo)
+
+    touched = batch_touched_paths(str(test_repo), shas)
+
+    assert touched == {sha: ["file.txt"] for sha in shas[:3]} | {shas[3]: ["other.txt"]}
+    assert batch_touched_paths(str(test_repo), [shas[0], "0" * 40]) == {}
+
+
+def test_batch_commit_meta_resolves_abbreviations_and_skips_unknown(test_repo: Path):
+    from git_release_notes.utils.git import batch_commit_meta
+
+    shas = get_log_shas(test_repo)
+
+    meta = batch_commit_meta(str(test_repo), [shas[0], shas[2][:10], "0" * 40, "no-such-ref"])
+
+    assert set(meta) == {shas[0], shas[2][:10]}
+    assert meta[shas[0]]["subject"] == "first"
+    assert meta[shas[2][:10]]["sha"] == shas[2]
+    assert meta[shas[2][:10]]["short_sha"] == shas[2][: len(meta[shas[2][:10]]["short_sha"])]
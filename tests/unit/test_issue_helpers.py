@@ -38,3 +38,15 @@ def test_find_issue_file_returns_none_if_missing(tmp_path):
     issues_dir = tmp_path / "issues"
     found = find_issue_file("nope", issues_dir)
     assert found is None
+
+
+def test_find_issue_file_sees_issues_added_and_removed_after_a_lookup(tmp_path):
+    issues_dir = tmp_path / "issues"
+    (issues_dir / "open").mkdir(parents=True)
+    assert find_issue_file("late", issues_dir) is None
+
+    (issues_dir / "open" / "late.md").write_text("# late\n")
+    assert find_issue_file("late", issues_dir) == issues_dir / "open" / "late.md"
+
+    (issues_dir / "open" / "late.md").unlink()
+    assert find_issue_file("late", issues_dir) is None
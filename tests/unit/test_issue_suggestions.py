@@ -0,0 +1,50 @@
+from git_release_notes.utils.issue_suggestions import compute_issue_suggestion
+
+
+def _write_issue(repo, status, slug):
+    path = repo / "issues" / status / f"{slug}.md"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(f"# {slug}\n", encoding="utf-8")
+
+
+def test_directive_matches_existing_issue_in_either_status(tmp_path):
+    _write_issue(tmp_path, "open", "alpha")
+    _write_issue(tmp_path, "closed", "beta")
+
+    result = compute_issue_suggestion(tmp_path, "Fixes #beta, refs #alpha and #missing")
+
+    assert result.message_matches == ["beta", "alpha"]
+    assert result.suggestion == "beta"
+    assert result.suggestion_source == "directive"
+
+
+def test_issue_created_after_a_lookup_is_seen(tmp_path):
+    _write_issue(tmp_path, "open", "alpha")
+    assert compute_issue_suggestion(tmp_path, "Fixes #gamma").message_matches == []
+
+    _write_issue(tmp_path, "open", "gamma")
+
+    assert compute_issue_suggestion(tmp_path, "Fixes #gamma").message_matches == ["gamma"]
+
+
+def test_touched_issue_files_are_deduplicated_in_order(tmp_path):
+    _write_issue(tmp_path, "open", "alpha")
+
+    result = compute_issue_suggestion(
+        tmp_path,
+        "Refs #alpha",
+        touched_paths=["issues/open/beta.md", "issues/open/alpha.md", "issues/closed/beta.md"],
+    )
+
+    assert result.existing_issues == ["alpha", "beta"]
+    assert result.touched_issue_slugs == ["beta"]
+
+
+def test_repeat_lookups_reuse_the_memoized_result(tmp_path):
+    _write_issue(tmp_path, "open", "alpha")
+
+    first = compute_issue_suggestion(tmp_path, "Refs #alpha", touched_paths=["src/app.py"])
+    again = compute_issue_suggestion(tmp_path, "Refs #alpha", touched_paths=("src/app.py",))
+
+    assert again is first
+    assert first.suggestion == "alpha"
@@ -1,5 +1,7 @@
 """Coverage for commit metadata store helpers."""
 
+import asyncio
+import os
 from pathlib import Path
 
 import pandas as pd
@@ -95,3 +97,178 @@ def test_spreadsheet_store_reload_reads_updated_workbook(tmp_path):
 
     assert store.shas_for_issue("alpha") == []
     assert store.shas_for_issue("delta") == ["ddd444"]
+
+
+def test_dataframe_store_get_row_tracks_edits_and_reloads(tmp_path):
+    csv_path = tmp_path / "metadata.csv"
+    _write_csv(csv_path, [{"sha": "aaa111", "issue": "alpha", "release": ""}])
+
+    store = DataFrameCommitMetadataStore(csv_path)
+    assert store.get_row("aaa111")["issue"] == "alpha"
+    assert store.get_row("missing") is None
+
+    store.set_issue("aaa111", "beta")
+    store.set_release("bbb222", "rel-1")
+    assert store.get_row("aaa111")["issue"] == "beta"
+    assert store.get_row("bbb222")["release"] == "rel-1"
+
+    _write_csv(csv_path, [{"sha": "ccc333", "issue": "gamma", "release": ""}])
+    store.reload()
+    assert store.get_row("aaa111") is None
+    assert store.get_row("ccc333")["issue"] == "gamma"
+
+
+def test_spreadsheet_store_get_row_returns_independent_copies(tmp_path):
+    rows = [{"sha": "aaa111", "issue": "alpha", "release": ""}]
+    store = SpreadsheetCommitMetadataStore(pd.DataFrame(rows), tmp_path / "metadata.xlsx")
+
+    row = store.get_row("aaa111")
+    row["issue"] = "mutated"
+    assert store.get_row("aaa111")["issue"] == "alpha"
+
+    store.set_issue("aaa111", "beta")
+    assert store.get_row("aaa111")["issue"] == "beta"
+
+
+def test_dataframe_store_reload_skips_unchanged_file(tmp_path, monkeypatch):
+    csv_path = tmp_path / "metadata.csv"
+    _write_csv(csv_path, [{"sha": "aaa111", "issue": "alpha", "release": ""}])
+    # Age the file past the racy window so an unchanged signature can be trusted.
+    past = os.stat(csv_path).st_mtime - 10
+    os.utime(csv_path, (past, past))
+
+    store = DataFrameCommitMetadataStore(csv_path)
+    reads = []
+    real_read_csv = pd.read_csv
+    monkeypatch.setattr(pd, "read_csv", lambda *a, **kw: reads.append(a) or real_read_csv(*a, **kw))
+
+    store.reload()
+    assert reads == []
+
+    _write_csv(csv_path, [{"sha": "bbb222", "issue": "beta", "release": ""}])
+    store.reload()
+
+    assert len(reads) == 1
+    assert store.shas_for_issue("beta") == ["bbb222"]
+
+
+def test_dataframe_store_version_tracks_edits(tmp_path):
+    csv_path = tmp_path / "metadata.csv"
+    _write_csv(csv_path, [{"sha": "aaa111", "issue": "old", "release": "rel-0"}])
+    store = DataFrameCommitMetadataStore(csv_path)
+
+    before = store.version
+    store.set_issue("aaa111", "alpha")
+    after_issue = store.version
+    store.set_release("bbb222", "rel-1")
+
+    assert before < after_issue < store.version
+
+
+def test_spreadsheet_store_appends_missing_rows_and_updates_duplicates(tmp_path):
+    rows = [
+        {"sha": "aaa111", "issue": "alpha", "release": ""},
+        {"sha": "aaa111", "issue": "alpha", "release": ""},
+    ]
+    store = SpreadsheetCommitMetadataStore(pd.DataFrame(rows), tmp_path / "metadata.xlsx")
+
+    store.set_issue("aaa111", "beta")
+    store.set_issue("ccc333", "gamma")
+    store.set_release("ccc333", "rel-1")
+
+    assert store.shas_for_issue("beta") == ["aaa111", "aaa111"]
+    assert store.get_row("ccc333") == {"sha": "ccc333", "issue": "gamma", "release": "rel-1"}
+    assert len(store.get_metadata_df()) == 3
+
+
+def test_dataframe_store_adds_columns_missing_from_the_csv(tmp_path):
+    csv_path = tmp_path / "metadata.csv"
+    _write_csv(csv_path, [{"sha": "aaa", "issue": "alpha"}])
+    store = DataFrameCommitMetadataStore(csv_path)
+
+    store.set_release("bbb", "rel-1")
+    store.set_release("aaa", "rel-2")
+
+    assert store.get_row("bbb")["release"] == "rel-1"
+    assert store.get_row("aaa") == {"sha": "aaa", "issue": "alpha", "release": "rel-2"}
+
+
+def test_save_soon_coalesces_a_burst_into_one_save(tmp_path, monkeypatch):
+    store = DataFrameCommitMetadataStore(tmp_path / "metadata.csv")
+    saved = []
+    monkeypatch.setattr(store, "save", lambda: saved.append(store.get_row("aaa111")["issue"]))
+
+    async def burst():
+        for slug in ("alpha", "beta"):
+            store.set_issue("aaa111", slug)
+            store.save_soon(0.01)
+        # A reload while the save is pending must not discard the unsaved edits.
+        store.reload()
+        assert store.get_row("aaa111")["issue"] == "beta"
+        await asyncio.sleep(0.05)
+
+    asyncio.run(burst())
+    assert saved == ["beta"]
+
+
+def test_failed_deferred_save_is_recorded_until_a_save_succeeds(tmp_path, monkeypatch):
+    store = DataFrameCommitMetadataStore(tmp_path / "metadata.csv")
+    failures = [OSError("disk full")]
+
+    def save():
+        if failures:
+            raise failures.pop()
+
+    monkeypatch.setattr(store, "save", save)
+
+    async def edit_and_wait():
+        store.set_issue("aaa111", "alpha")
+        store.save_soon(0.01)
+        await asyncio.sleep(0.05)
+
+    asyncio.run(edit_and_wait())
+    assert isinstance(store.last_save_error, OSError)
+    # Unsaved edits survive a reload while the failure stands.
+    store.reload()
+    assert store.get_row("aaa111")["issue"] == "alpha"
+
+    store.save_soon(0)
+    assert store.last_save_error is None
+
+
+def test_save_soon_without_delay_raises_save_errors(tmp_path, monkeypatch):
+    store = DataFrameCommitMetadataStore(tmp_path / "metadata.csv")
+
+    def save():
+        raise OSError("read-only")
+
+    monkeypatch.setattr(store, "save", save)
+
+    async def edit():
+        store.set_issue("aaa111", "alpha")
+        try:
+            store.save_soon(0)
+        except OSError:
+            return True
+        return False
+
+    assert asyncio.run(edit())
+    assert isinstance(store.last_save_error, OSError)
+
+
+def test_dataframe_store_normalizes_empty_and_numeric_cells_to_strings(tmp_path):
+    csv_path = tmp_path / "metadata.csv"
+    _write_csv(
+        csv_path,
+        [
+            {"sha": "aaa111", "issue": None, "release": 1.5},
+            {"sha": "bbb222", "issue": None, "release": None},
+        ],
+    )
+
+    store = DataFrameCommitMetadataStore(csv_path)
+
+    assert store.get_row("aaa111") == {"sha": "aaa111", "issue": "", "release": "1.5"}
+    assert store.get_row("bbb222") == {"sha": "bbb222", "issue": "", "release": ""}
+    store.set_issue("bbb222", "beta")
+    assert store.get_row("bbb222")["issue"] == "beta"
@@ -7,6 +7,7 @@ Functions under test:
 - find_follows_tag(): identifies the nearest preceding tag.
 - find_precedes_tag(): identifies the nearest descendant tag.
 - get_matching_tag_commits(): filters matching tags.
+- get_tag_commit_sha(): peels a tag to its commit.
 - get_topo_ordered_commits(): confirms topo sort matches rev-list.
 - is_ancestor(): verifies ancestry relationship between commits.
 - parse_describe_output(): parses `git describe` output.
@@ -126,6 +127,20 @@ def test_find_precedes_tag_returns_none_if_no_descendant_match(test_repo: Path):
     assert result is None
 
 
+def test_find_precedes_tag_ignores_tags_on_unrelated_branches(test_repo: Path):
+    import subprocess
+
+    shas = get_log_shas(test_repo)
+    subprocess.run(["git", "checkout", "-q", "-b", "side", shas[0]], cwd=test_repo, check=True)
+    (test_repo / "side.txt").write_text("side\n")
+    subprocess.run(["git", "add", "side.txt"], cwd=test_repo, check=True)
+    subprocess.run(["git", "commit", "-q", "-m", "side"], cwd=test_repo, check=True)
+    create_tag(test_repo, "HEAD", "rel-side")
+
+    assert find_precedes_tag(shas[1], str(test_repo), "rel-*") is None
+    assert find_precedes_tag(shas[0], str(test_repo), "rel-*").base_tag == "rel-side"
+
+
 def test_get_matching_tag_commits(test_repo: Path):
     shas = get_log_shas(test_repo)
     create_tag(test_repo, shas[1], "rel-1")
@@ -141,6 +156,46 @@ def test_get_matching_tag_commits(test_repo: Path):
     assert result[shas[1]] == "rel-1"
 
 
+def test_get_matching_tag_commits_peels_annotated_tags(test_repo: Path):
+    import subprocess
+
+    shas = get_log_shas(test_repo)
+    create_tag(test_repo, shas[0], "rel-1")
+    subprocess.run(["git", "tag", "-a", "rel-2", "-m", "annotated", shas[2]], cwd=test_repo, check=True)
+
+    from git_release_notes.utils.git import get_matching_tag_commits
+
+    result = get_matching_tag_commits(str(test_repo), "rel-*")
+
+    assert result == {shas[0]: "rel-1", shas[2]: "rel-2"}
+
+
+def test_get_matching_tag_commits_matches_across_slashes_like_fnmatch(test_repo: Path):
+    shas = get_log_shas(test_repo)
+    create_tag(test_repo, shas[0], "rel-team/1")
+    create_tag(test_repo, shas[1], "rel-2")
+    create_tag(test_repo, shas[2], "other-3")
+
+    from git_release_notes.utils.git import get_matching_tag_commits
+
+    assert get_matching_tag_commits(str(test_repo), "rel-*") == {shas[0]: "rel-team/1", shas[1]: "rel-2"}
+    assert get_matching_tag_commits(str(test_repo), "*-3") == {shas[2]: "other-3"}
+
+
+def test_get_tag_commit_sha(test_repo: Path):
+    import subprocess
+
+    from git_release_notes.utils.git import get_tag_commit_sha
+
+    shas = get_log_shas(test_repo)
+    create_tag(test_repo, shas[0], "rel-1")
+    subprocess.run(["git", "tag", "-a", "rel-2", "-m", "annotated", shas[1]], cwd=test_repo, check=True)
+
+    assert get_tag_commit_sha("rel-1", str(test_repo)) == shas[0]
+    assert get_tag_commit_sha("rel-2", str(test_repo)) == shas[1]
+    assert get_tag_commit_sha("rel-missing", str(test_repo)) is None
+
+
 def test_get_topo_ordered_commits(test_repo: Path):
     from git_release_notes.utils.git import get_topo_ordered_commits
 